@@ -0,0 +1,13 @@
+"""
+Shared pytest setup for the test scripts in the project root.
+
+Puts the project root on sys.path once so the scripts can import the src and
+app packages without each adjusting the path.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
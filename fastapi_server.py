@@ -4,6 +4,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 import uvicorn
 import subprocess
+from contextlib import asynccontextmanager
 from pathlib import Path
 import sys
 import os
@@ -12,9 +13,19 @@ import os
 sys.path.insert(0, os.path.abspath('.'))
 
 # Import the analyzer
-from src.integrations.metro.analyzer import analyze_property
+from src.integrations.metro.analyzer import analyze_property_async
+from src.integrations.metro.arcgis_client_async import create_session
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled ArcGIS session for the life of the server, shared by all requests
+    app.state.arcgis_session = create_session()
+    try:
+        yield
+    finally:
+        await app.state.arcgis_session.close()
+
+app = FastAPI(lifespan=lifespan)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -58,14 +69,14 @@ async def read_root(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 @app.post("/analyze")
-async def analyze_property_endpoint(request: dict):
+async def analyze_property_endpoint(request: dict, http_request: Request):
     try:
         address = request.get("address")
         if not address:
             raise HTTPException(status_code=400, detail="Address is required")
             
         # Call the analyzer
-        result = analyze_property(address)
+        result = await analyze_property_async(address, http_request.app.state.arcgis_session)
         
         # Add any additional processing here if needed
         return JSONResponse(content=result)
@@ -6,21 +6,154 @@ various Metro Nashville GIS services including parcels, zoning, flood zones,
 and development cases.
 """
 
+import copy
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 
 from src.config.metro import METRO
-from .build_summary import build_summary_stub
-from .arcgis_client import (
-    geocode_address,
-    get_parcel_at_point,
-    get_base_zoning,
-    get_zoning_overlays,
-    get_flood_hazards,
-    get_nearby_cases,
-    Point,
-    Feature
-)
+from .cache import TTLCache, cache_key
+
+# arcgis_client pulls in requests/urllib3 (and pyproj on first projection), so it
+# is imported on first use rather than when this module is loaded
+_ARCGIS_CLIENT_NAMES = frozenset({
+    "geocode_address",
+    "get_parcel_at_point",
+    "get_base_zoning",
+    "get_zoning_overlays",
+    "get_flood_hazards",
+    "get_nearby_cases",
+    "count_nearby_cases",
+    "dumps_geometry",
+    "parcel_query_geometry",
+    "CASE_FIELDS",
+    "Point",
+    "Feature",
+})
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve names re-exported from arcgis_client and build_summary lazily (PEP 562)."""
+    if name in _ARCGIS_CLIENT_NAMES:
+        from . import arcgis_client
+        return getattr(arcgis_client, name)
+    if name == "build_summary_stub":
+        from .build_summary import build_summary_stub
+        return build_summary_stub
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Cap on concurrent ArcGIS requests per analysis, to stay clear of Metro's throttling
+MAX_WORKERS = 6
+
+# Seconds to wait for the concurrent layer queries to finish
+LAYER_QUERY_TIMEOUT = 60
+
+# What a layer contributes to the result when its lookup doesn't finish in time
+_EMPTY_LAYERS = {
+    "base_zoning": None,
+    "overlays": [],
+    "flood_approved": [],
+    "flood_pending": [],
+    "nearby_cases": [],
+    "total_cases": 0,
+}
+
+# Seconds a successful analysis is reused for repeat lookups of the same address
+RESULT_CACHE_TTL = 3600
+
+_RESULT_CACHE = TTLCache(maxsize=512)
+
+
+def _result_key(address: str) -> str:
+    """Cache key for an address, ignoring case and whitespace differences."""
+    return cache_key(" ".join(address.lower().split()))
+
+
+def _cached_result(address: str) -> Optional[Dict[str, Any]]:
+    """Return a private copy of the cached analysis for an address, or None."""
+    cached = _RESULT_CACHE.get(_result_key(address), RESULT_CACHE_TTL)
+    return copy.deepcopy(cached) if cached is not None else None
+
+
+def _new_result(address: str) -> Dict[str, Any]:
+    """Initialize an analysis result with timestamp and input."""
+    return {
+        "metadata": {
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "source": "Metro Nashville GIS Services"
+        },
+        "input": {"address": address}
+    }
+
+
+def _parcel_section(parcel: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the parcel section of a result from a parcel feature."""
+    return {
+        "attributes": parcel.get("attributes"),
+        "geometry": parcel.get("geometry"),
+        "sources": [METRO["PARCELS"]]
+    }
+
+
+def _complete_result(
+    result: Dict[str, Any],
+    layers: Dict[str, Any],
+    failed_layers: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Fill in the zoning, constraints and context sections from the layer lookups.
+    
+    Args:
+        result: Result from _new_result() with input and parcel filled in
+        layers: Lookup results keyed by "base_zoning", "overlays", "flood_approved",
+            "flood_pending", "nearby_cases" and "total_cases"
+        failed_layers: Keys of layers whose lookup failed and were left empty
+        
+    Returns:
+        The completed result. A copy is stored in the result cache unless a
+        layer lookup failed, so the next request for the address retries it.
+    """
+    from .build_summary import build_summary_stub
+    
+    base_zoning = layers["base_zoning"]
+    
+    result["zoning"] = {
+        "base": base_zoning,
+        "overlays": layers["overlays"],
+        "sources": [METRO["BASE_ZONING"], METRO["ZONING_OVERLAYS"]],
+        "last_updated": result["metadata"]["generated_at"]
+    }
+    
+    result["constraints"] = {
+        "flood_approved": layers["flood_approved"],
+        "flood_pending": layers["flood_pending"],
+        "sources": [METRO["FEMA_APPROVED"], METRO["FEMA_PENDING"]]
+    }
+    
+    result["context"] = {
+        "nearby_development_cases": layers["nearby_cases"],
+        "total_cases_found": layers["total_cases"],
+        "sources": [METRO["DEV_CASES"]]
+    }
+    
+    # Add DTC documentation if in Downtown Code district
+    is_dtc = bool(base_zoning and base_zoning.get("ZONE_CODE") == "DTC")
+    result["dtc_docs"] = {"pdf": METRO["DTC_PDF"]} if is_dtc else {}
+    
+    result["disclaimers"] = [
+        "Metro GIS data; verify with Planning/Codes.",
+        "Flood info from FEMA layers; see FEMA MSC for official determinations.",
+    ]
+    
+    result["build_summary"] = build_summary_stub(result)
+    
+    result["metadata"]["status"] = "success"
+    if failed_layers:
+        result["metadata"]["failed_layers"] = list(failed_layers)
+    else:
+        _RESULT_CACHE.set(_result_key(result["input"]["address"]), copy.deepcopy(result))
+    return result
 
 
 def analyze_property(address: str) -> Dict[str, Any]:
@@ -39,14 +172,24 @@ def analyze_property(address: str) -> Dict[str, Any]:
         - Nearby development cases
         - Source references and disclaimers
     """
-    # Initialize result with timestamp and input
-    result = {
-        "metadata": {
-            "generated_at": datetime.utcnow().isoformat() + "Z",
-            "source": "Metro Nashville GIS Services"
-        },
-        "input": {"address": address}
-    }
+    from .arcgis_client import (
+        geocode_address,
+        get_parcel_at_point,
+        get_base_zoning,
+        get_zoning_overlays,
+        get_flood_hazards,
+        get_nearby_cases,
+        count_nearby_cases,
+        parcel_query_geometry,
+        CASE_FIELDS,
+    )
+    
+    # Serve repeat lookups of the same address from the result cache
+    cached = _cached_result(address)
+    if cached is not None:
+        return cached
+    
+    result = _new_result(address)
     
     try:
         # Step 1: Geocode the address
@@ -56,104 +199,179 @@ def analyze_property(address: str) -> Dict[str, Any]:
             
         result["input"]["geocode"] = geo
         lon, lat = geo["location"]["x"], geo["location"]["y"]
+        point = {"x": lon, "y": lat}
+        
+        # Managed by hand rather than with "with", which would wait for every
+        # lookup still running on an early return or a timeout
+        executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        try:
+            # Base zoning and nearby cases only need the geocoded point, so start
+            # them while the parcel lookup runs
+            futures = {
+                executor.submit(
+                    get_base_zoning, METRO["BASE_ZONING"], None, point=point, raise_errors=True
+                ): "base_zoning",
+                executor.submit(
+                    get_nearby_cases, METRO["DEV_CASES"], lon, lat,
+                    meters=800, out_fields=CASE_FIELDS, result_record_count=20  # 20 most recent
+                ): "nearby_cases",
+                executor.submit(count_nearby_cases, METRO["DEV_CASES"], lon, lat, meters=800): "total_cases",
+            }
+            
+            # Step 2: Get parcel information
+            parcel = get_parcel_at_point(METRO["PARCELS"], point)
+            if not parcel:
+                return {
+                    "error": "No parcel found at the specified location",
+                    **result
+                }
+                
+            result["parcel"] = _parcel_section(parcel)
+            
+            # Steps 3-4: Overlays and flood hazards intersect the parcel polygon;
+            # project it to Web Mercator and serialize it once for all three queries
+            geometry_str = parcel_query_geometry(parcel) if parcel.get("geometry") else None
+            futures[executor.submit(
+                get_zoning_overlays, METRO["ZONING_OVERLAYS"], parcel, geometry_str
+            )] = "overlays"
+            futures[executor.submit(
+                get_flood_hazards, METRO["FEMA_APPROVED"], parcel, geometry_str
+            )] = "flood_approved"
+            futures[executor.submit(
+                get_flood_hazards, METRO["FEMA_PENDING"], parcel, geometry_str
+            )] = "flood_pending"
+            
+            layers = {}
+            failed_layers = []
+            try:
+                for future in as_completed(futures, timeout=LAYER_QUERY_TIMEOUT):
+                    name = futures[future]
+                    try:
+                        layers[name] = future.result()
+                    except ValueError:
+                        # A missing base zoning doesn't sink the analysis; any other
+                        # failed lookup does
+                        if name != "base_zoning":
+                            raise
+                        layers[name] = None
+                        failed_layers.append(name)
+            except FuturesTimeoutError:
+                # Report the layers still running as failed instead of waiting on them
+                for name in futures.values():
+                    if name not in layers:
+                        layers[name] = _EMPTY_LAYERS[name]
+                        failed_layers.append(name)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return _complete_result(result, layers, failed_layers)
+        
+    except Exception as e:
+        result["error"] = f"Error analyzing property: {str(e)}"
+        result["metadata"]["status"] = "error"
+        return result
+
+
+async def analyze_property_async(address: str, session=None) -> Dict[str, Any]:
+    """
+    Coroutine version of analyze_property() using the aiohttp ArcGIS client.
+    
+    All ArcGIS requests run on the event loop instead of worker threads, so one
+    process can keep many analyses in flight at once.
+    
+    Args:
+        address: The property address to analyze (e.g., "100 Broadway, Nashville, TN")
+        session: Optional aiohttp session from arcgis_client_async.create_session()
+            to reuse across analyses; a temporary one is created otherwise
+        
+    Returns:
+        The same dictionary as analyze_property()
+    """
+    import asyncio
+    from .arcgis_client import parcel_query_geometry, CASE_FIELDS
+    from . import arcgis_client_async as arcgis
+    
+    cached = _cached_result(address)
+    if cached is not None:
+        return cached
+    
+    if session is None:
+        async with arcgis.create_session() as session:
+            return await analyze_property_async(address, session)
+    
+    result = _new_result(address)
+    
+    try:
+        # Step 1: Geocode the address
+        geo = await arcgis.geocode_address(session, METRO["GEOCODER"], address)
+        if not geo:
+            return {"error": "Address not found", **result}
+            
+        result["input"]["geocode"] = geo
+        lon, lat = geo["location"]["x"], geo["location"]["y"]
+        point = {"x": lon, "y": lat}
+        
+        # Base zoning and nearby cases only need the geocoded point, so start
+        # them while the parcel lookup runs
+        failed_layers = []
+        
+        async def base_zoning_or_none():
+            # A missing base zoning doesn't sink the analysis, as in analyze_property()
+            try:
+                return await arcgis.get_base_zoning(
+                    session, METRO["BASE_ZONING"], None, point=point, raise_errors=True
+                )
+            except ValueError:
+                failed_layers.append("base_zoning")
+                return None
+        
+        point_tasks = asyncio.gather(
+            base_zoning_or_none(),
+            arcgis.get_nearby_cases(
+                session, METRO["DEV_CASES"], lon, lat,
+                meters=800, out_fields=CASE_FIELDS, result_record_count=20  # 20 most recent
+            ),
+            arcgis.count_nearby_cases(session, METRO["DEV_CASES"], lon, lat, meters=800),
+        )
         
         # Step 2: Get parcel information
-        parcel = get_parcel_at_point(METRO["PARCELS"], {"x": lon, "y": lat})
+        try:
+            parcel = await arcgis.get_parcel_at_point(session, METRO["PARCELS"], point)
+        except BaseException:
+            point_tasks.cancel()
+            await asyncio.gather(point_tasks, return_exceptions=True)
+            raise
         if not parcel:
+            # Retrieve the cancelled lookups so asyncio doesn't log them as never retrieved
+            point_tasks.cancel()
+            await asyncio.gather(point_tasks, return_exceptions=True)
             return {
                 "error": "No parcel found at the specified location",
                 **result
             }
             
-        result["parcel"] = {
-            "attributes": parcel.get("attributes"),
-            "geometry": parcel.get("geometry"),
-            "sources": [METRO["PARCELS"]]
-        }
-        
-        # Step 3: Get zoning information
-        base_zoning = get_base_zoning(METRO["BASE_ZONING"], parcel)
-        overlays = get_zoning_overlays(METRO["ZONING_OVERLAYS"], parcel)
-        
-        result["zoning"] = {
-            "base": base_zoning,
-            "overlays": overlays,
-            "sources": [METRO["BASE_ZONING"], METRO["ZONING_OVERLAYS"]],
-            "last_updated": datetime.utcnow().isoformat() + "Z"
-        }
+        result["parcel"] = _parcel_section(parcel)
         
-        # Step 4: Get flood hazard information
-        flood_approved = get_flood_hazards(METRO["FEMA_APPROVED"], parcel)
-        flood_pending = get_flood_hazards(METRO["FEMA_PENDING"], parcel)
+        # Steps 3-4: Overlays and flood hazards intersect the parcel polygon
+        geometry_str = parcel_query_geometry(parcel) if parcel.get("geometry") else None
+        (base_zoning, nearby_cases, total_cases), overlays, flood_approved, flood_pending = await asyncio.wait_for(
+            asyncio.gather(
+                point_tasks,
+                arcgis.get_zoning_overlays(session, METRO["ZONING_OVERLAYS"], parcel, geometry_str),
+                arcgis.get_flood_hazards(session, METRO["FEMA_APPROVED"], parcel, geometry_str),
+                arcgis.get_flood_hazards(session, METRO["FEMA_PENDING"], parcel, geometry_str),
+            ),
+            timeout=LAYER_QUERY_TIMEOUT
+        )
         
-        result["hazards"] = {
+        return _complete_result(result, {
+            "base_zoning": base_zoning,
+            "overlays": overlays,
             "flood_approved": flood_approved,
             "flood_pending": flood_pending,
-            "sources": [METRO["FEMA_APPROVED"], METRO["FEMA_PENDING"]]
-        }
-        
-        # Step 5: Get nearby development cases
-        nearby_cases = get_nearby_cases(METRO["DEV_CASES"], lon, lat, meters=800)
-        
-        result["context"] = {
-            "nearby_development_cases": nearby_cases[:20],  # Limit to 20 most recent
-            "total_cases_found": len(nearby_cases),
-            "sources": [METRO["DEV_CASES"]]
-        }
-        
-        # Add DTC documentation if in Downtown Code district
-        if base_zoning and base_zoning.get("ZONE_CODE") == "DTC":
-            result["dtc_docs"] = {
-                "pdf": METRO["DTC_PDF"],
-                "description": "Downtown Code (DTC) District Information"
-            }
-        
-        # Add disclaimers and metadata
-        result["disclaimers"] = [
-            "This information is provided as a convenience only and is not an official record.",
-            "Metro GIS data should be verified with the relevant Metro departments.",
-            "Flood zone information is from FEMA layers; see FEMA for official determinations.",
-            "Zoning information is subject to change. Verify with Metro Planning Department."
-        ]
-        
-        # Generate summary
-        result["summary"] = build_summary_stub(result)
-        
-        # Create the final structured result
-        structured_result = {
-            "input": {"address": address, "geocode": result["input"].get("geocode")},
-            "parcel": {
-                "attributes": result.get("parcel", {}).get("attributes"),
-                "geometry": result.get("parcel", {}).get("geometry"),
-                "sources": [METRO["PARCELS"]],
-            },
-            "zoning": {
-                "base": result.get("zoning", {}).get("base"),
-                "overlays": result.get("zoning", {}).get("overlays", []),
-                "sources": [METRO["BASE_ZONING"], METRO["ZONING_OVERLAYS"]],
-            },
-            "constraints": {
-                "flood_approved": result.get("hazards", {}).get("flood_approved", []),
-                "flood_pending": result.get("hazards", {}).get("flood_pending", []),
-                "sources": [METRO["FEMA_APPROVED"], METRO["FEMA_PENDING"]],
-            },
-            "context": {
-                "nearby_development_cases": result.get("context", {}).get("nearby_development_cases", []),
-                "sources": [METRO["DEV_CASES"]],
-            },
-            "dtc_docs": {"pdf": METRO["DTC_PDF"]} if result.get("dtc_docs") else {},
-            "disclaimers": [
-                "Metro GIS data; verify with Planning/Codes.",
-                "Flood info from FEMA layers; see FEMA MSC for official determinations.",
-            ],
-            "metadata": result.get("metadata", {})
-        }
-        
-        # Add build summary to the structured result
-        structured_result["build_summary"] = result["summary"]
-        
-        result["metadata"]["status"] = "success"
-        return structured_result
+            "nearby_cases": nearby_cases,
+            "total_cases": total_cases,
+        }, failed_layers)
         
     except Exception as e:
         result["error"] = f"Error analyzing property: {str(e)}"
@@ -163,7 +381,7 @@ def analyze_property(address: str) -> Dict[str, Any]:
 
 if __name__ == "__main__":
     # Example usage
-    import json
+    import orjson
     
     # Test with a sample address
     address = "100 Broadway, Nashville, TN"
@@ -187,10 +405,10 @@ if __name__ == "__main__":
             zone = result["zoning"]["base"]
             print(f"Zoning: {zone.get('ZONE_CODE', 'N/A')} - {zone.get('ZONE_DESC', 'N/A')}")
         
-        if "hazards" in result:
-            hazards = result["hazards"]
-            print(f"Flood Zones (Approved): {[h.get('FloodZone') for h in hazards.get('flood_approved', [])] or 'None'}")
-            print(f"Flood Zones (Pending): {[h.get('FloodZone') for h in hazards.get('flood_pending', [])] or 'None'}")
+        if "constraints" in result:
+            constraints = result["constraints"]
+            print(f"Flood Zones (Approved): {[h.get('FloodZone') for h in constraints.get('flood_approved', [])] or 'None'}")
+            print(f"Flood Zones (Pending): {[h.get('FloodZone') for h in constraints.get('flood_pending', [])] or 'None'}")
         
         if "context" in result and "nearby_development_cases" in result["context"]:
             cases = result["context"]["nearby_development_cases"]
@@ -201,6 +419,6 @@ if __name__ == "__main__":
                 print(f"     Status: {case.get('STATUS')}")
     
     # Save full results to file
-    with open("property_analysis.json", "w") as f:
-        json.dump(result, f, indent=2)
+    with open("property_analysis.json", "wb") as f:
+        f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
     print("\nFull analysis saved to property_analysis.json")
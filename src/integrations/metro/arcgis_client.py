@@ -6,10 +6,141 @@ including geocoding addresses, parcel lookups, and spatial queries.
 """
 
 import json
+import logging
+import threading
+from functools import lru_cache
+from types import MappingProxyType
 from urllib.parse import quote
 from typing import Dict, Optional, Any, List, TypedDict, Union
+import ijson
+import orjson
 import requests
 from src.config.metro import METRO
+from .cache import TTLCache, cache_key, returns_copy
+
+logger = logging.getLogger(__name__)
+
+# How long cached layer query results stay fresh, in seconds. Parcels and
+# zoning/FEMA layers change on a scale of weeks; development cases move faster.
+LAYER_CACHE_TTL = 86400
+DEV_CASES_CACHE_TTL = 3600
+
+_CACHE = TTLCache(maxsize=4096)
+
+# StatePlane Tennessee FIPS 4100 Feet, the spatial reference of the base zoning layer
+STATE_PLANE_WKID = 2274
+
+# Web Mercator; ESRI's 102100 is EPSG:3857
+WEB_MERCATOR_WKID = 102100
+
+# Parcel fields returned by get_parcel_at_point() unless others are requested
+DEFAULT_PARCEL_FIELDS = (
+    "OBJECTID,ParID,APN,Owner,PropAddr,PropHouse,PropStreet,PropCity,PropState,PropZip,"
+    "Acres,DeededAcreage,STANPAR,LUCode,LUDesc"
+)
+
+# Fields returned for FEMA flood hazard features
+FLOOD_FIELDS = "FloodZone,ZoneDescription,AdoptedDate,OBJECTID"
+
+# Development case fields shown in analysis results
+CASE_FIELDS = "CASE_NUMBER,CASE_TYPE,STATUS,PROJECT_NAME,ADDRESS,APPLICATION_DATE,STATUS_DATE"
+
+# Query parameters shared by every call of the same kind; per-call values are merged in
+_POINT_QUERY_PARAMS = MappingProxyType({
+    "f": "json",
+    "geometryType": "esriGeometryPoint",
+    "inSR": 4326,
+    "spatialRel": "esriSpatialRelIntersects",
+})
+_PARCEL_QUERY_PARAMS = MappingProxyType({
+    **_POINT_QUERY_PARAMS,
+    "outSR": 4326,
+    "returnExtentOnly": False,
+    "returnDistinctValues": False,
+    "returnZ": False,
+    "returnM": False,
+})
+_NEARBY_QUERY_PARAMS = MappingProxyType({
+    **_POINT_QUERY_PARAMS,
+    "units": "esriSRUnit_Meter",
+})
+_POLYGON_QUERY_PARAMS = MappingProxyType({
+    "f": "json",
+    "geometryType": "esriGeometryPolygon",
+    "spatialRel": "esriSpatialRelIntersects",
+    "returnGeometry": False,
+})
+
+
+def dumps_geometry(geometry: Dict[str, Any]) -> str:
+    """Serialize a geometry to compact ArcGIS JSON for use as a query parameter."""
+    return json.dumps(geometry, separators=(",", ":"))
+
+
+def _check_response(js: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Raise if an ArcGIS response body reports an error, otherwise return it.
+    
+    ArcGIS answers failed queries with HTTP 200 and an "error" object, so the
+    body has to be checked before the result is parsed or cached.
+    
+    Raises:
+        ValueError: If the response contains an "error" key
+    """
+    if "error" in js:
+        raise ValueError(f"ArcGIS error: {js['error']}")
+    return js
+
+
+def _build_session() -> requests.Session:
+    """Create the pooled keep-alive session shared by all ArcGIS requests.
+
+    Each host pool holds more connections than the analyzer has workers, so
+    parallel layer queries reuse warm HTTP/1.1 connections after the first
+    analysis instead of reconnecting.
+
+    Returns:
+        Session with retrying connection pools mounted for HTTP and HTTPS
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["GET", "POST"]),  # ArcGIS queries are read-only
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept-Encoding": "gzip"})
+    return session
+
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _session() -> requests.Session:
+    """Return the shared ArcGIS session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _build_session()
+    return _SESSION
+
+
+@lru_cache(maxsize=None)
+def _transformer(from_wkid: int, to_wkid: int):
+    """Return a cached lon/lat-ordered pyproj Transformer between two WKIDs.
+    
+    pyproj is imported here rather than at module import, as loading PROJ is slow.
+    """
+    from pyproj import Transformer
+    return Transformer.from_crs(from_wkid, to_wkid, always_xy=True)
 
 
 class Point(TypedDict):
@@ -32,6 +163,71 @@ class Feature(TypedDict, total=False):
     geometry: Geometry
 
 
+def project_geometry(geometry: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Project a WGS84 point or polygon geometry to Web Mercator (WKID 102100).
+    
+    Layer queries default to inSR=102100; projecting on the client once lets the
+    same geometry be reused across queries without server-side reprojection.
+    
+    Args:
+        geometry: Geometry in ArcGIS JSON format, in WGS84 unless its
+            spatialReference says otherwise
+        
+    Returns:
+        A new geometry in Web Mercator (or the input, if it already is)
+    """
+    sr = geometry.get("spatialReference") or {}
+    if (sr.get("latestWkid") or sr.get("wkid")) in (WEB_MERCATOR_WKID, 3857):
+        return geometry
+    
+    transformer = _transformer(4326, 3857)
+    projected: Dict[str, Any] = {"spatialReference": {"wkid": WEB_MERCATOR_WKID, "latestWkid": 3857}}
+    if "rings" in geometry:
+        rings = []
+        for ring in geometry["rings"]:
+            xs, ys = transformer.transform([pt[0] for pt in ring], [pt[1] for pt in ring])
+            rings.append([[x, y] for x, y in zip(xs, ys)])
+        projected["rings"] = rings
+    else:
+        projected["x"], projected["y"] = transformer.transform(geometry["x"], geometry["y"])
+    return projected
+
+
+def parcel_query_geometry(parcel_feature: Feature, geometry_str: Optional[str] = None) -> str:
+    """
+    Serialized Web Mercator parcel geometry for intersect queries.
+    
+    Args:
+        parcel_feature: Parcel feature from get_parcel_at_point()
+        geometry_str: Result of a previous call for the same parcel, returned as-is
+        
+    Returns:
+        Geometry string to pass as geometry_str to the layer queries
+    """
+    if geometry_str is not None:
+        return geometry_str
+    return dumps_geometry(project_geometry(parcel_feature["geometry"]))
+
+
+def _parse_geocode(js: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Extract the best candidate from a findAddressCandidates response, or None."""
+    if not js.get("candidates"):
+        return None
+        
+    candidate = js["candidates"][0]
+    return {
+        "match_addr": candidate.get("address"),
+        "score": candidate.get("score"),
+        "location": {
+            "x": candidate["location"]["x"],  # longitude
+            "y": candidate["location"]["y"]   # latitude
+        }
+    }
+
+
+@returns_copy
+@lru_cache(maxsize=4096)
 def geocode_address(geocoder_url: str, single_line: str, timeout: int = 20) -> Optional[Dict[str, Any]]:
     """
     Geocode an address using Metro Nashville's geocoding service.
@@ -58,35 +254,29 @@ def geocode_address(geocoder_url: str, single_line: str, timeout: int = 20) -> O
     }
     
     try:
-        r = requests.get(
+        r = _session().get(
             f"{geocoder_url}/findAddressCandidates",
             params=params,
             timeout=timeout
         )
         r.raise_for_status()
         
-        js = r.json()
-        if not js.get("candidates"):
-            return None
-            
-        candidate = js["candidates"][0]
-        return {
-            "match_addr": candidate.get("address"),
-            "score": candidate.get("score"),
-            "location": {
-                "x": candidate["location"]["x"],  # longitude
-                "y": candidate["location"]["y"]   # latitude
-            }
-        }
+        return _parse_geocode(_check_response(orjson.loads(r.content)))
         
-    except requests.exceptions.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON response: {e}")
     except KeyError as e:
         raise ValueError(f"Missing expected field in response: {e}")
 
 
 # Convenience function using default Metro Nashville geocoder
-def get_parcel_at_point(parcels_url: str, point: Point, out_fields: str = None) -> Optional[Feature]:
+@returns_copy
+def get_parcel_at_point(
+    parcels_url: str,
+    point: Point,
+    out_fields: str = None,
+    ttl_seconds: float = LAYER_CACHE_TTL
+) -> Optional[Feature]:
     """
     Find a parcel that intersects the given point.
 
@@ -94,6 +284,7 @@ def get_parcel_at_point(parcels_url: str, point: Point, out_fields: str = None)
         parcels_url: The URL of the parcels feature service
         point: Dictionary with 'x' (longitude) and 'y' (latitude) keys
         out_fields: Comma-separated list of fields to return. Defaults to common parcel fields.
+        ttl_seconds: How long a cached result for the same query stays fresh
 
     Returns:
         Feature dictionary with attributes and geometry if found, None otherwise
@@ -102,35 +293,26 @@ def get_parcel_at_point(parcels_url: str, point: Point, out_fields: str = None)
         requests.exceptions.RequestException: If the request fails
         ValueError: If the response is not valid JSON or is missing required fields
     """
-    # Default fields to request if none specified
-    if out_fields is None:
-        out_fields = "OBJECTID,ParID,APN,Owner,PropAddr,PropHouse,PropStreet,PropCity,PropState,PropZip,Acres,DeededAcreage,STANPAR,LUCode,LUDesc"
-    
     params = {
-        "f": "json",
-        "geometry": json.dumps({"x": point["x"], "y": point["y"], "spatialReference": {"wkid": 4326}}),
-        "geometryType": "esriGeometryPoint",
-        "inSR": 4326,
-        "spatialRel": "esriSpatialRelIntersects",
-        "outFields": out_fields,
+        **_PARCEL_QUERY_PARAMS,
+        "geometry": dumps_geometry({"x": point["x"], "y": point["y"], "spatialReference": {"wkid": 4326}}),
+        "outFields": out_fields or DEFAULT_PARCEL_FIELDS,
         "returnGeometry": True,
-        "outSR": 4326,
-        "returnExtentOnly": False,
-        "returnDistinctValues": False,
-        "returnZ": False,
-        "returnM": False
     }
     
-    try:
-        r = requests.get(f"{parcels_url}/query", params=params, timeout=20)
-        r.raise_for_status()
-        
-        js = r.json()
-        features = js.get("features", [])
-        return features[0] if features else None
-        
-    except (json.JSONDecodeError, KeyError, IndexError) as e:
-        raise ValueError(f"Failed to parse parcel data: {e}")
+    def fetch() -> Optional[Feature]:
+        try:
+            r = _session().get(f"{parcels_url}/query", params=params, timeout=20)
+            r.raise_for_status()
+            
+            js = _check_response(orjson.loads(r.content))
+            features = js.get("features", [])
+            return features[0] if features else None
+            
+        except (orjson.JSONDecodeError, KeyError, IndexError) as e:
+            raise ValueError(f"Failed to parse parcel data: {e}")
+    
+    return _CACHE.get_or_fetch(cache_key(parcels_url, params), ttl_seconds, fetch)
 
 
 def metro_geocode(address: str) -> Optional[Dict[str, Any]]:
@@ -155,7 +337,7 @@ def _encode_geometry_for_query(geom_json: Dict[str, Any]) -> str:
     Returns:
         URL-encoded geometry string
     """
-    return quote(json.dumps(geom_json))
+    return quote(dumps_geometry(geom_json))
 
 
 def intersect_layer_with_polygon(
@@ -163,7 +345,9 @@ def intersect_layer_with_polygon(
     polygon_geom: Dict[str, Any], 
     out_fields: str = "*",
     in_sr: int = 102100,
-    out_sr: int = 4326
+    out_sr: int = 4326,
+    ttl_seconds: float = LAYER_CACHE_TTL,
+    geometry_str: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
     Find features in a layer that intersect with the given polygon.
@@ -174,6 +358,9 @@ def intersect_layer_with_polygon(
         out_fields: Comma-separated list of fields to return (default: all fields)
         in_sr: Spatial reference of input geometry (default: Web Mercator)
         out_sr: Spatial reference for output features (default: WGS84)
+        ttl_seconds: How long a cached result for the same query stays fresh
+        geometry_str: polygon_geom already serialized with dumps_geometry() (in in_sr),
+            to avoid re-serializing the same parcel for every layer
         
     Returns:
         List of matching features with attributes
@@ -183,125 +370,149 @@ def intersect_layer_with_polygon(
         ValueError: If the response is not valid JSON
     """
     params = {
-        "f": "json",
-        "geometry": json.dumps(polygon_geom),
-        "geometryType": "esriGeometryPolygon",
+        **_POLYGON_QUERY_PARAMS,
+        "geometry": geometry_str if geometry_str is not None else dumps_geometry(polygon_geom),
         "inSR": in_sr,
         "outSR": out_sr,
-        "spatialRel": "esriSpatialRelIntersects",
         "outFields": out_fields,
-        "returnGeometry": False,
     }
     
-    try:
-        r = requests.post(f"{layer_url}/query", data=params, timeout=30)
-        r.raise_for_status()
-        return r.json().get("features", [])
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON response: {e}")
+    def fetch() -> List[Dict[str, Any]]:
+        # Overlay responses for dense downtown parcels can be large, so parse the
+        # features off the wire rather than materializing the whole payload first
+        try:
+            with _session().post(f"{layer_url}/query", data=params, timeout=30, stream=True) as r:
+                r.raise_for_status()
+                r.raw.decode_content = True
+                # Top-level keys are tiny apart from "features", which is built
+                # item by item; "error" has to be seen before anything is cached
+                js = _check_response(dict(ijson.kvitems(r.raw, "", use_float=True)))
+                return js.get("features", [])
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON response: {e}")
+    
+    return _CACHE.get_or_fetch(cache_key(layer_url, params), ttl_seconds, fetch)
 
 
-def get_base_zoning(base_zoning_url: str, parcel: Feature) -> Optional[Dict[str, Any]]:
-    """
-    Get the base zoning for a parcel.
+def _point_from_parcel(parcel: Optional[Feature]) -> Optional[Dict[str, Any]]:
+    """Pick a representative point from a parcel's geometry.
     
     Args:
-        base_zoning_url: URL of the base zoning layer (expects StatePlane Tennessee FIPS 4100 Feet)
         parcel: Parcel feature from get_parcel_at_point() in WGS84 (lat/lon)
         
     Returns:
-        Zoning attributes if found, None otherwise
+        Point dictionary, or None if the parcel has no usable geometry
     """
     if not parcel or 'geometry' not in parcel:
         return None
     
-    # First, get the point coordinates from the parcel geometry
     geometry = parcel['geometry']
     
     # Handle different geometry formats
     if 'x' in geometry and 'y' in geometry:
         # Point geometry
-        point = {
+        return {
             'x': geometry['x'],
             'y': geometry['y'],
             'spatialReference': geometry.get('spatialReference', {'wkid': 4326})
         }
-    elif 'rings' in geometry and geometry['rings'] and geometry['rings'][0]:
+    if 'rings' in geometry and geometry['rings'] and geometry['rings'][0]:
         # Polygon geometry - use the first point of the first ring
-        point = {
+        return {
             'x': geometry['rings'][0][0][0],
             'y': geometry['rings'][0][0][1],
             'spatialReference': geometry.get('spatialReference', {'wkid': 4326})
         }
-    else:
-        print(f"Unsupported geometry format: {json.dumps(geometry, indent=2)[:200]}...")
-        return None
-    
+    logger.warning("Unsupported geometry format: %s...", json.dumps(geometry)[:200])
+    return None
+
+
+def _base_zoning_params(point: Dict[str, Any]) -> Dict[str, Any]:
+    """Build base zoning query params for a WGS84 point."""
     # Convert to StatePlane Tennessee FIPS 4100 Feet (WKID 2274)
-    transform_url = "https://sampleserver6.arcgisonline.com/arcgis/rest/services/Utilities/Geometry/GeometryServer/project"
-    params = {
+    x, y = _transformer(4326, STATE_PLANE_WKID).transform(point['x'], point['y'])
+    transformed_point = {'x': x, 'y': y, 'spatialReference': {'wkid': STATE_PLANE_WKID}}
+    return {
         'f': 'json',
-        'inSR': 4326,  # WGS84
-        'outSR': 2274,  # StatePlane Tennessee FIPS 4100 Feet
-        'geometries': json.dumps({
-            'geometryType': 'esriGeometryPoint',
-            'geometries': [point]
-        })
+        'geometry': dumps_geometry(transformed_point),
+        'geometryType': 'esriGeometryPoint',
+        'inSR': STATE_PLANE_WKID,
+        'spatialRel': 'esriSpatialRelIntersects',
+        'outFields': 'ZONE_DESC,CASE_NO,ORDINANCE,NAME',
+        'returnGeometry': False
     }
+
+
+def _parse_base_zoning(js: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Extract zoning attributes from a base zoning query response, or None."""
+    features = js.get('features', [])
+    if not features:
+        return None
+        
+    # Get the first feature's attributes
+    attrs = features[0].get('attributes', {})
     
-    try:
-        response = requests.post(transform_url, data=params, timeout=20)
-        response.raise_for_status()
-        transformed_geoms = response.json().get('geometries', [])
+    return {
+        'ZONE_CODE': attrs.get('ZONE_DESC'),
+        'ZONE_DESC': attrs.get('ZONE_DESC'),
+        'CASE_NO': attrs.get('CASE_NO'),
+        'ORDINANCE': attrs.get('ORDINANCE'),
+        'NAME': attrs.get('NAME')
+    }
+
+
+def get_base_zoning(
+    base_zoning_url: str,
+    parcel: Optional[Feature],
+    point: Optional[Point] = None,
+    raise_errors: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Get the base zoning for a parcel.
+    
+    Args:
+        base_zoning_url: URL of the base zoning layer (expects StatePlane Tennessee FIPS 4100 Feet)
+        parcel: Parcel feature from get_parcel_at_point() in WGS84 (lat/lon)
+        point: WGS84 point inside the parcel (e.g. the geocoded address). When given,
+            the parcel geometry isn't needed and parcel may be None.
+        raise_errors: Raise ValueError when the lookup fails instead of logging
+            it and returning None, so callers can tell a failure from no match
         
-        if not transformed_geoms:
+    Returns:
+        Zoning attributes if found, None otherwise
+    """
+    if point is None:
+        point = _point_from_parcel(parcel)
+        if point is None:
             return None
-            
-        transformed_point = transformed_geoms[0]
-        
-        # Query the zoning layer with the transformed point
-        query_url = f"{base_zoning_url}/query"
-        params = {
-            'f': 'json',
-            'geometry': json.dumps(transformed_point),
-            'geometryType': 'esriGeometryPoint',
-            'inSR': 2274,  # StatePlane Tennessee FIPS 4100 Feet
-            'spatialRel': 'esriSpatialRelIntersects',
-            'outFields': 'ZONE_DESC,CASE_NO,ORDINANCE,NAME',
-            'returnGeometry': False
-        }
-        
-        response = requests.get(query_url, params=params, timeout=20)
+    
+    # Query the zoning layer with the point in StatePlane
+    query_url = f"{base_zoning_url}/query"
+    try:
+        response = _session().get(query_url, params=_base_zoning_params(point), timeout=20)
         response.raise_for_status()
-        result = response.json()
-        
-        features = result.get('features', [])
-        if not features:
-            return None
-            
-        # Get the first feature's attributes
-        attrs = features[0].get('attributes', {})
-        
-        return {
-            'ZONE_CODE': attrs.get('ZONE_DESC'),
-            'ZONE_DESC': attrs.get('ZONE_DESC'),
-            'CASE_NO': attrs.get('CASE_NO'),
-            'ORDINANCE': attrs.get('ORDINANCE'),
-            'NAME': attrs.get('NAME')
-        }
-        
-    except Exception as e:
-        print(f"Error getting base zoning: {str(e)}")
+        js = _check_response(orjson.loads(response.content))
+    except (requests.RequestException, ValueError) as e:
+        if raise_errors:
+            raise ValueError(f"Error getting base zoning: {e}") from e
+        logger.warning("Error getting base zoning: %s", e)
         return None
+    
+    return _parse_base_zoning(js)
 
 
-def get_zoning_overlays(overlay_url: str, parcel_feature: Feature) -> List[Dict[str, Any]]:
+def get_zoning_overlays(
+    overlay_url: str,
+    parcel_feature: Feature,
+    geometry_str: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """
     Get all zoning overlays that intersect with a parcel.
     
     Args:
         overlay_url: URL of the zoning overlays layer
         parcel_feature: Parcel feature from get_parcel_at_point()
+        geometry_str: Parcel geometry from parcel_query_geometry(), if already computed
         
     Returns:
         List of overlay attributes
@@ -312,18 +523,24 @@ def get_zoning_overlays(overlay_url: str, parcel_feature: Feature) -> List[Dict[
     features = intersect_layer_with_polygon(
         overlay_url,
         parcel_feature["geometry"],
-        out_fields="*"
+        out_fields="*",
+        geometry_str=parcel_query_geometry(parcel_feature, geometry_str)
     )
     return [f["attributes"] for f in features]
 
 
-def get_flood_hazards(fema_layer_url: str, parcel_feature: Feature) -> List[Dict[str, Any]]:
+def get_flood_hazards(
+    fema_layer_url: str,
+    parcel_feature: Feature,
+    geometry_str: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """
     Get FEMA flood hazard information for a parcel.
     
     Args:
         fema_layer_url: URL of the FEMA flood hazard layer
         parcel_feature: Parcel feature from get_parcel_at_point()
+        geometry_str: Parcel geometry from parcel_query_geometry(), if already computed
         
     Returns:
         List of flood hazard attributes including FloodZone, ZoneDescription, etc.
@@ -342,7 +559,8 @@ def get_flood_hazards(fema_layer_url: str, parcel_feature: Feature) -> List[Dict
     features = intersect_layer_with_polygon(
         fema_layer_url,
         parcel_feature["geometry"],
-        out_fields="FloodZone,ZoneDescription,AdoptedDate,OBJECTID"
+        out_fields=FLOOD_FIELDS,
+        geometry_str=parcel_query_geometry(parcel_feature, geometry_str)
     )
     return [f["attributes"] for f in features]
 
@@ -352,7 +570,9 @@ def get_nearby_cases(
     lon: float, 
     lat: float, 
     meters: int = 800,
-    out_fields: str = "*"
+    out_fields: str = "*",
+    ttl_seconds: float = DEV_CASES_CACHE_TTL,
+    result_record_count: Optional[int] = 20
 ) -> List[Dict[str, Any]]:
     """
     Get development cases near a geographic point.
@@ -363,6 +583,9 @@ def get_nearby_cases(
         lat: Latitude of the center point
         meters: Search radius in meters (default: 800m)
         out_fields: Comma-separated list of fields to return (default: all fields)
+        ttl_seconds: How long a cached result for the same query stays fresh
+        result_record_count: Maximum number of (most recent) cases the server returns;
+            None for no limit
         
     Returns:
         List of development case attributes
@@ -379,24 +602,64 @@ def get_nearby_cases(
         }]
     """
     params = {
-        "f": "json",
+        **_NEARBY_QUERY_PARAMS,
         "geometry": f"{lon},{lat}",
-        "geometryType": "esriGeometryPoint",
-        "inSR": 4326,
-        "spatialRel": "esriSpatialRelIntersects",
         "distance": meters,
-        "units": "esriSRUnit_Meter",
         "outFields": out_fields,
         "returnGeometry": False,
         "orderByFields": "STATUS_DATE DESC"  # Most recent first
     }
+    if result_record_count is not None:
+        params["resultRecordCount"] = result_record_count
+        params["resultOffset"] = 0
     
-    try:
-        r = requests.get(f"{dev_cases_url}/query", params=params, timeout=20)
-        r.raise_for_status()
-        return [f["attributes"] for f in r.json().get("features", [])]
-    except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
-        raise ValueError(f"Failed to fetch development cases: {e}")
+    def fetch() -> List[Dict[str, Any]]:
+        try:
+            r = _session().get(f"{dev_cases_url}/query", params=params, timeout=20)
+            r.raise_for_status()
+            return [f["attributes"] for f in _check_response(orjson.loads(r.content)).get("features", [])]
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            raise ValueError(f"Failed to fetch development cases: {e}")
+    
+    return _CACHE.get_or_fetch(cache_key(dev_cases_url, params), ttl_seconds, fetch)
+
+
+def count_nearby_cases(
+    dev_cases_url: str,
+    lon: float,
+    lat: float,
+    meters: int = 800,
+    ttl_seconds: float = DEV_CASES_CACHE_TTL
+) -> int:
+    """
+    Count development cases near a geographic point without fetching them.
+    
+    Args:
+        dev_cases_url: URL of the development cases layer
+        lon: Longitude of the center point
+        lat: Latitude of the center point
+        meters: Search radius in meters (default: 800m)
+        ttl_seconds: How long a cached result for the same query stays fresh
+        
+    Returns:
+        Number of cases within the search radius
+    """
+    params = {
+        **_NEARBY_QUERY_PARAMS,
+        "geometry": f"{lon},{lat}",
+        "distance": meters,
+        "returnCountOnly": True
+    }
+    
+    def fetch() -> int:
+        try:
+            r = _session().get(f"{dev_cases_url}/query", params=params, timeout=20)
+            r.raise_for_status()
+            return _check_response(orjson.loads(r.content)).get("count", 0)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            raise ValueError(f"Failed to count development cases: {e}")
+    
+    return _CACHE.get_or_fetch(cache_key(dev_cases_url, params), ttl_seconds, fetch)
 
 
 if __name__ == "__main__":
@@ -471,7 +734,7 @@ if __name__ == "__main__":
             lon=result["location"]["x"],
             lat=result["location"]["y"],
             meters=800,
-            out_fields="CASE_NUMBER,CASE_TYPE,STATUS,PROJECT_NAME,ADDRESS,APPLICATION_DATE,STATUS_DATE"
+            out_fields=CASE_FIELDS
         )
         if cases:
             print(f"Found {len(cases)} nearby development case(s):")
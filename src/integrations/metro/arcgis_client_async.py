@@ -0,0 +1,326 @@
+"""
+Asyncio ArcGIS REST API client for Metro Nashville GIS services.
+
+Coroutine counterparts of the lookups in arcgis_client, built on aiohttp so that
+many analyses can keep their ArcGIS requests in flight on one event loop. Query
+parameters, response parsing and the result cache are shared with the
+synchronous client.
+"""
+
+import asyncio
+import copy
+import logging
+from typing import Dict, Optional, Any, List
+
+import aiohttp
+import orjson
+
+from .cache import cache_key
+from .arcgis_client import (
+    _CACHE,
+    _NEARBY_QUERY_PARAMS,
+    _PARCEL_QUERY_PARAMS,
+    _POLYGON_QUERY_PARAMS,
+    _base_zoning_params,
+    _check_response,
+    _parse_base_zoning,
+    _parse_geocode,
+    _point_from_parcel,
+    dumps_geometry,
+    parcel_query_geometry,
+    DEFAULT_PARCEL_FIELDS,
+    DEV_CASES_CACHE_TTL,
+    FLOOD_FIELDS,
+    LAYER_CACHE_TTL,
+    Feature,
+    Point,
+)
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def create_session() -> aiohttp.ClientSession:
+    """
+    Create a pooled aiohttp session for ArcGIS requests.
+
+    Must be called from within a running event loop; close it (or use it as an
+    async context manager) when done.
+    """
+    connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+    return aiohttp.ClientSession(connector=connector, headers={"Accept-Encoding": "gzip"})
+
+
+def _encode_params(params: Dict[str, Any]) -> Dict[str, str]:
+    """aiohttp only accepts str/int/float values, so spell booleans out as ArcGIS expects."""
+    return {
+        key: ("true" if value else "false") if isinstance(value, bool) else str(value)
+        for key, value in params.items()
+    }
+
+
+async def _get_json(session: aiohttp.ClientSession, url: str, params: Dict[str, Any], timeout: float = 20) -> Any:
+    async with session.get(url, params=_encode_params(params), timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+        r.raise_for_status()
+        return _check_response(orjson.loads(await r.read()))
+
+
+async def _post_json(session: aiohttp.ClientSession, url: str, params: Dict[str, Any], timeout: float = 30) -> Any:
+    async with session.post(url, data=_encode_params(params), timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+        r.raise_for_status()
+        return _check_response(orjson.loads(await r.read()))
+
+
+async def geocode_address(
+    session: aiohttp.ClientSession,
+    geocoder_url: str,
+    single_line: str,
+    timeout: int = 20
+) -> Optional[Dict[str, Any]]:
+    """
+    Geocode an address using Metro Nashville's geocoding service.
+
+    See arcgis_client.geocode_address().
+    """
+    params = {
+        "f": "json",
+        "SingleLine": single_line,
+        "outFields": "Match_addr,Addr_type,Score",
+        "maxLocations": 1,
+        "outSR": 4326,  # WGS84
+    }
+    key = cache_key(geocoder_url, params)
+    cached = _CACHE.get(key, LAYER_CACHE_TTL, _MISSING)
+    if cached is not _MISSING:
+        return copy.deepcopy(cached)
+
+    try:
+        js = await _get_json(session, f"{geocoder_url}/findAddressCandidates", params, timeout)
+        result = _parse_geocode(js)
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON response: {e}")
+    except KeyError as e:
+        raise ValueError(f"Missing expected field in response: {e}")
+
+    _CACHE.set(key, result)
+    return copy.deepcopy(result)
+
+
+async def get_parcel_at_point(
+    session: aiohttp.ClientSession,
+    parcels_url: str,
+    point: Point,
+    out_fields: str = None,
+    ttl_seconds: float = LAYER_CACHE_TTL
+) -> Optional[Feature]:
+    """
+    Find a parcel (attributes and geometry) that intersects the given point.
+
+    See arcgis_client.get_parcel_at_point().
+    """
+    params = {
+        **_PARCEL_QUERY_PARAMS,
+        "geometry": dumps_geometry({"x": point["x"], "y": point["y"], "spatialReference": {"wkid": 4326}}),
+        "outFields": out_fields or DEFAULT_PARCEL_FIELDS,
+        "returnGeometry": True,
+    }
+    key = cache_key(parcels_url, params)
+    cached = _CACHE.get(key, ttl_seconds, _MISSING)
+    if cached is not _MISSING:
+        return copy.deepcopy(cached)
+
+    try:
+        features = (await _get_json(session, f"{parcels_url}/query", params)).get("features", [])
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"Failed to parse parcel data: {e}")
+
+    parcel = features[0] if features else None
+    _CACHE.set(key, parcel)
+    return copy.deepcopy(parcel)
+
+
+async def intersect_layer_with_polygon(
+    session: aiohttp.ClientSession,
+    layer_url: str,
+    polygon_geom: Dict[str, Any],
+    out_fields: str = "*",
+    in_sr: int = 102100,
+    out_sr: int = 4326,
+    ttl_seconds: float = LAYER_CACHE_TTL,
+    geometry_str: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Find features in a layer that intersect with the given polygon.
+
+    See arcgis_client.intersect_layer_with_polygon().
+    """
+    params = {
+        **_POLYGON_QUERY_PARAMS,
+        "geometry": geometry_str if geometry_str is not None else dumps_geometry(polygon_geom),
+        "inSR": in_sr,
+        "outSR": out_sr,
+        "outFields": out_fields,
+    }
+    key = cache_key(layer_url, params)
+    cached = _CACHE.get(key, ttl_seconds, _MISSING)
+    if cached is not _MISSING:
+        return cached
+
+    try:
+        features = (await _post_json(session, f"{layer_url}/query", params)).get("features", [])
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON response: {e}")
+
+    _CACHE.set(key, features)
+    return features
+
+
+async def get_base_zoning(
+    session: aiohttp.ClientSession,
+    base_zoning_url: str,
+    parcel: Optional[Feature],
+    point: Optional[Point] = None,
+    raise_errors: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Get the base zoning for a parcel, or for a WGS84 point inside it.
+
+    See arcgis_client.get_base_zoning().
+    """
+    if point is None:
+        point = _point_from_parcel(parcel)
+        if point is None:
+            return None
+
+    try:
+        js = await _get_json(session, f"{base_zoning_url}/query", _base_zoning_params(point))
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        if raise_errors:
+            raise ValueError(f"Error getting base zoning: {e}") from e
+        logger.warning("Error getting base zoning: %s", e)
+        return None
+
+    return _parse_base_zoning(js)
+
+
+async def get_zoning_overlays(
+    session: aiohttp.ClientSession,
+    overlay_url: str,
+    parcel_feature: Feature,
+    geometry_str: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get all zoning overlays that intersect with a parcel.
+
+    See arcgis_client.get_zoning_overlays().
+    """
+    if not parcel_feature or "geometry" not in parcel_feature:
+        return []
+
+    features = await intersect_layer_with_polygon(
+        session,
+        overlay_url,
+        parcel_feature["geometry"],
+        out_fields="*",
+        geometry_str=parcel_query_geometry(parcel_feature, geometry_str)
+    )
+    return [f["attributes"] for f in features]
+
+
+async def get_flood_hazards(
+    session: aiohttp.ClientSession,
+    fema_layer_url: str,
+    parcel_feature: Feature,
+    geometry_str: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get FEMA flood hazard information for a parcel.
+
+    See arcgis_client.get_flood_hazards().
+    """
+    if not parcel_feature or "geometry" not in parcel_feature:
+        return []
+
+    features = await intersect_layer_with_polygon(
+        session,
+        fema_layer_url,
+        parcel_feature["geometry"],
+        out_fields=FLOOD_FIELDS,
+        geometry_str=parcel_query_geometry(parcel_feature, geometry_str)
+    )
+    return [f["attributes"] for f in features]
+
+
+async def get_nearby_cases(
+    session: aiohttp.ClientSession,
+    dev_cases_url: str,
+    lon: float,
+    lat: float,
+    meters: int = 800,
+    out_fields: str = "*",
+    ttl_seconds: float = DEV_CASES_CACHE_TTL,
+    result_record_count: Optional[int] = 20
+) -> List[Dict[str, Any]]:
+    """
+    Get the most recent development cases near a geographic point.
+
+    See arcgis_client.get_nearby_cases().
+    """
+    params = {
+        **_NEARBY_QUERY_PARAMS,
+        "geometry": f"{lon},{lat}",
+        "distance": meters,
+        "outFields": out_fields,
+        "returnGeometry": False,
+        "orderByFields": "STATUS_DATE DESC"  # Most recent first
+    }
+    if result_record_count is not None:
+        params["resultRecordCount"] = result_record_count
+        params["resultOffset"] = 0
+    key = cache_key(dev_cases_url, params)
+    cached = _CACHE.get(key, ttl_seconds, _MISSING)
+    if cached is not _MISSING:
+        return cached
+
+    try:
+        js = await _get_json(session, f"{dev_cases_url}/query", params)
+    except (aiohttp.ClientError, orjson.JSONDecodeError) as e:
+        raise ValueError(f"Failed to fetch development cases: {e}")
+
+    cases = [f["attributes"] for f in js.get("features", [])]
+    _CACHE.set(key, cases)
+    return cases
+
+
+async def count_nearby_cases(
+    session: aiohttp.ClientSession,
+    dev_cases_url: str,
+    lon: float,
+    lat: float,
+    meters: int = 800,
+    ttl_seconds: float = DEV_CASES_CACHE_TTL
+) -> int:
+    """
+    Count development cases near a geographic point without fetching them.
+
+    See arcgis_client.count_nearby_cases().
+    """
+    params = {
+        **_NEARBY_QUERY_PARAMS,
+        "geometry": f"{lon},{lat}",
+        "distance": meters,
+        "returnCountOnly": True
+    }
+    key = cache_key(dev_cases_url, params)
+    cached = _CACHE.get(key, ttl_seconds, _MISSING)
+    if cached is not _MISSING:
+        return cached
+
+    try:
+        count = (await _get_json(session, f"{dev_cases_url}/query", params)).get("count", 0)
+    except (aiohttp.ClientError, orjson.JSONDecodeError) as e:
+        raise ValueError(f"Failed to count development cases: {e}")
+
+    _CACHE.set(key, count)
+    return count
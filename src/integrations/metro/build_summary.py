@@ -5,8 +5,34 @@ This module provides functions to generate a summary of zoning analysis results
 in a structured format for display in the UI.
 """
 
+import re
 from typing import Dict, Any, Optional, List
 
+# Overlay keyword patterns and the flag each raises; all rules are compiled into
+# a single alternation so a scan stays one pass as rules are added
+_OVERLAY_FLAG_RULES = {
+    "historic": (r"HIST|CONSERVATION|NC", "Historic/Conservation review likely"),
+}
+_OVERLAY_FLAG_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, (pattern, _) in _OVERLAY_FLAG_RULES.items()),
+    re.IGNORECASE
+)
+
+# Candidate attribute names, in order of preference; adjust once you inspect actual attributes
+_ACREAGE_KEYS = ("Acres", "DeededAcreage")
+_BASE_CODE_KEYS = ("ZONE_CODE", "ZONE", "BASE_ZONE", "DISTRICT")
+_OVERLAY_LABEL_KEYS = ("ZONINGNAME", "OVERLAY_NAME", "NAME", "ZONING")
+_OVERLAY_CODE_KEYS = ("ZONING", "CODE")
+_FLOOD_ZONE_KEYS = ("FloodZone", "FLOODZONE")
+
+# FEMA Special Flood Hazard Area zone codes
+_SFHA_CODES = frozenset(("AE", "A", "VE", "FW"))
+
+
+def _first(attrs: Dict[str, Any], keys, default: Any = None) -> Any:
+    """Return the first truthy value among attrs[key] for key in keys, else default."""
+    return next((attrs[k] for k in keys if attrs.get(k)), default)
+
 
 def _lot_area_sqft(parcel_attrs: Dict[str, Any]) -> Optional[float]:
     """
@@ -18,12 +44,12 @@ def _lot_area_sqft(parcel_attrs: Dict[str, Any]) -> Optional[float]:
     Returns:
         Lot area in square feet, or None if not available
     """
-    # Try common fields first; fall back to acres * 43560 if present
-    if "Acres" in parcel_attrs and isinstance(parcel_attrs["Acres"], (int, float)):
-        return float(parcel_attrs["Acres"]) * 43560.0
-    if "DeededAcreage" in parcel_attrs and isinstance(parcel_attrs["DeededAcreage"], (int, float)):
-        return float(parcel_attrs["DeededAcreage"]) * 43560.0
-    return None
+    # Use the first numeric acreage field: acres * 43560
+    acres = next(
+        (parcel_attrs[k] for k in _ACREAGE_KEYS if isinstance(parcel_attrs.get(k), (int, float))),
+        None
+    )
+    return float(acres) * 43560.0 if acres is not None else None
 
 
 def _overlay_flags(overlays_attrs):
@@ -38,14 +64,15 @@ def _overlay_flags(overlays_attrs):
     """
     names = []
     for o in overlays_attrs or []:
-        label = o.get("ZONINGNAME") or o.get("OVERLAY_NAME") or o.get("NAME") or o.get("ZONING") or "Overlay"
-        code = o.get("ZONING") or o.get("CODE") or ""
+        label = _first(o, _OVERLAY_LABEL_KEYS, "Overlay")
+        code = _first(o, _OVERLAY_CODE_KEYS, "")
         names.append(code or label)
     # flag a few common constraints
     flags = []
-    joined = " ".join(n.upper() for n in names)
-    if "HIST" in joined or "CONSERVATION" in joined or "NC" in joined:
-        flags.append("Historic/Conservation review likely")
+    for match in _OVERLAY_FLAG_RE.finditer(" ".join(names)):
+        flag = _OVERLAY_FLAG_RULES[match.lastgroup][1]
+        if flag not in flags:
+            flags.append(flag)
     return {"overlays": names, "flags": flags}
 
 
@@ -67,18 +94,15 @@ def build_summary_stub(analysis: Dict[str, Any]) -> Dict[str, Any]:
     lot_sqft = _lot_area_sqft(parcel_attrs)
     lot_acres = round(lot_sqft / 43560.0, 3) if lot_sqft else None
 
-    base_code = None
-    if isinstance(zoning_base, dict):
-        # Try common field names; adjust once you inspect actual attributes
-        base_code = zoning_base.get("ZONE_CODE") or zoning_base.get("ZONE") or zoning_base.get("BASE_ZONE") or zoning_base.get("DISTRICT")
+    base_code = _first(zoning_base, _BASE_CODE_KEYS) if isinstance(zoning_base, dict) else None
 
     overlay_info = _overlay_flags(overlays)
 
     # Flood quick flag
     flood_flags = []
     for f in flood_approved:
-        z = (f.get("FloodZone") or f.get("FLOODZONE") or "").upper()
-        if z in ("AE", "A", "VE", "FW"):  # Special Flood Hazard Areas
+        z = _first(f, _FLOOD_ZONE_KEYS, "").upper()
+        if z in _SFHA_CODES:
             flood_flags.append(f"Flood Zone {z}")
     if flood_flags:
         overlay_info["flags"].extend(flood_flags)
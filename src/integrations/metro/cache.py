@@ -0,0 +1,99 @@
+"""
+In-process TTL cache for Metro Nashville GIS lookups.
+
+Metro's parcel, zoning and FEMA layers change on a timescale of weeks, so
+repeat lookups for the same address or parcel geometry can be served from
+memory instead of going back to ArcGIS.
+"""
+
+import copy
+import functools
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+_MISSING = object()
+
+
+def cache_key(*parts: Any) -> str:
+    """
+    Build a stable cache key from JSON-serializable parts.
+
+    Args:
+        *parts: Values identifying the lookup (URL, geometry, out fields, ...)
+
+    Returns:
+        Hex SHA-256 digest of the parts
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def returns_copy(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap a cached lookup so each call returns its own deep copy of the result.
+
+    Callers can then modify what they get back without changing the cached value.
+    """
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return copy.deepcopy(func(*args, **kwargs))
+    return wrapper
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after a per-lookup TTL."""
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Args:
+            maxsize: Maximum number of entries; the oldest entry is evicted first
+        """
+        self.maxsize = maxsize
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, ttl_seconds: float, default: Any = None) -> Any:
+        """
+        Return the cached value for key if it is younger than ttl_seconds.
+
+        Args:
+            key: Cache key from cache_key()
+            ttl_seconds: Maximum age of the entry in seconds
+            default: Value returned on a miss or an expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= ttl_seconds:
+            return default
+        return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key, evicting the oldest entry when full."""
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic(), value)
+
+    def get_or_fetch(self, key: str, ttl_seconds: float, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling fetch() and caching its result on a miss.
+
+        Args:
+            key: Cache key from cache_key()
+            ttl_seconds: Maximum age of a cached entry in seconds
+            fetch: Zero-argument callable performing the actual lookup
+        """
+        value = self.get(key, ttl_seconds, _MISSING)
+        if value is _MISSING:
+            value = fetch()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
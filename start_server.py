@@ -4,69 +4,103 @@ Startup script for Nashville Zoning AI Assistant
 Handles initial setup and starts the FastAPI server
 """
 
+import importlib.util
 import os
 import sys
-import subprocess
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-def check_ollama():
+REQUIRED_PACKAGES = ("fastapi", "uvicorn", "langchain", "chromadb", "requests")
+OLLAMA_URL = "http://127.0.0.1:11434"
+REQUIRED_MODELS = ("llama3.1:8b", "nomic-embed-text")
+DOCUMENTS_DIR = "data/zoning_pdfs"
+REQUIRED_DOCUMENTS = ("nashville_zoning_code_2025.pdf",)
+MAX_CONCURRENT_PULLS = 2  # more parallel downloads just split the bandwidth
+
+def _has_model(installed, model):
+    """Check a model name against installed names; untagged names match any tag"""
+    return any(
+        name == model or (":" not in model and name.split(":", 1)[0] == model)
+        for name in installed
+    )
+
+def _pull_model(model, log=print):
+    """Pull a model through the Ollama REST API, raising on failure"""
+    import requests
+    
+    log(f"📥 Pulling required model: {model}")
+    response = requests.post(
+        f"{OLLAMA_URL}/api/pull",
+        json={"model": model, "stream": False},
+        timeout=None  # model downloads take minutes
+    )
+    response.raise_for_status()
+
+def check_ollama(log=print):
     """Check if Ollama is running and has required models"""
-    print("🔍 Checking Ollama setup...")
+    log("🔍 Checking Ollama setup...")
+    
+    import requests  # presence verified by check_dependencies
     
     try:
-        # Check if ollama is running
-        result = subprocess.run(["ollama", "list"], capture_output=True, text=True)
-        if result.returncode != 0:
-            print("❌ Ollama is not running. Please start it with: ollama serve")
-            return False
+        # Ask the Ollama server for its installed models
+        response = requests.get(f"{OLLAMA_URL}/api/tags", timeout=2)
+        response.raise_for_status()
+        installed = [m["name"] for m in response.json().get("models", [])]
         
-        models = result.stdout
-        required_models = ["llama3.1:8b", "nomic-embed-text"]
+        missing = [m for m in REQUIRED_MODELS if not _has_model(installed, m)]
+        if missing:
+            # Models are independent, so pull them concurrently
+            with ThreadPoolExecutor(max_workers=min(len(missing), MAX_CONCURRENT_PULLS)) as executor:
+                pulls = [executor.submit(_pull_model, model, log) for model in missing]
+            for pull in pulls:
+                pull.result()
         
-        for model in required_models:
-            if model not in models:
-                print(f"📥 Pulling required model: {model}")
-                subprocess.run(["ollama", "pull", model], check=True)
-        
-        print("✅ Ollama setup complete")
+        log("✅ Ollama setup complete")
         return True
         
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error with Ollama: {e}")
+    except requests.ConnectionError:
+        log("❌ Ollama is not running. Please start it with: ollama serve")
         return False
-    except FileNotFoundError:
-        print("❌ Ollama not found. Please install Ollama first.")
+    except (requests.RequestException, ValueError, KeyError) as e:
+        log(f"❌ Error with Ollama: {e}")
         return False
 
-def check_documents():
+def check_documents(log=print):
     """Check if Nashville Zoning Code PDF is present"""
-    print("🔍 Checking documents...")
+    log("🔍 Checking documents...")
+    
+    # List the directory once and check names against it
+    try:
+        with os.scandir(DOCUMENTS_DIR) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        present = set()
     
-    pdf_path = Path("data/zoning_pdfs/nashville_zoning_code_2025.pdf")
-    if not pdf_path.exists():
-        print("⚠️  Nashville Zoning Code PDF not found at data/zoning_pdfs/")
-        print("   Please ensure the PDF is in the correct location")
+    if not all(name in present for name in REQUIRED_DOCUMENTS):
+        log(f"⚠️  Nashville Zoning Code PDF not found at {DOCUMENTS_DIR}/")
+        log("   Please ensure the PDF is in the correct location")
         return False
     
-    print("✅ Documents found")
+    log("✅ Documents found")
     return True
 
 def check_dependencies():
     """Check if required Python packages are installed"""
     print("🔍 Checking dependencies...")
     
-    try:
-        import fastapi
-        import uvicorn
-        import langchain
-        import chromadb
-        import requests
-        print("✅ Dependencies installed")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
+    # find_spec locates each package without importing it (langchain and
+    # chromadb take seconds to import)
+    missing = [
+        name for name in REQUIRED_PACKAGES
+        if importlib.util.find_spec(name) is None
+    ]
+    if missing:
+        print(f"❌ Missing dependency: {', '.join(missing)}")
         print("   Run: pip install -r requirements.txt")
         return False
+    
+    print("✅ Dependencies installed")
+    return True
 
 def start_server():
     """Start the FastAPI server"""
@@ -77,12 +111,9 @@ def start_server():
     print("-" * 50)
     
     try:
-        subprocess.run([
-            "uvicorn", "app.api:app", 
-            "--reload", 
-            "--host", "0.0.0.0", 
-            "--port", "8000"
-        ])
+        # Serve from this interpreter rather than spawning the uvicorn CLI
+        import uvicorn
+        uvicorn.run("app.api:app", host="0.0.0.0", port=8000, reload=True)
     except KeyboardInterrupt:
         print("\n👋 Server stopped")
     except Exception as e:
@@ -93,14 +124,24 @@ def main():
     print("🏢 Nashville Zoning AI Assistant")
     print("=" * 40)
     
-    # Check all prerequisites
+    # The Ollama check needs requests, so there is nothing to check without it
     if not check_dependencies():
         sys.exit(1)
     
-    if not check_ollama():
+    # The remaining checks are independent, so run them concurrently; each
+    # collects its messages so they print in order instead of interleaved
+    ollama_log, documents_log = [], []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ollama_ok = executor.submit(check_ollama, ollama_log.append)
+        documents_ok = executor.submit(check_documents, documents_log.append)
+    
+    for message in ollama_log + documents_log:
+        print(message)
+    
+    if not ollama_ok.result():
         sys.exit(1)
     
-    if not check_documents():
+    if not documents_ok.result():
         print("⚠️  Continuing without documents - some features may not work")
     
     # Start the server
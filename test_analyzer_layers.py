@@ -0,0 +1,188 @@
+"""
+Tests for how the Metro property analyzer handles failed and slow layer lookups.
+
+The ArcGIS client functions are replaced with fakes, so no requests leave the
+process.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("ijson")
+pytest.importorskip("orjson")
+pytest.importorskip("pyproj")
+
+from src.integrations.metro import analyzer, arcgis_client
+
+ADDRESS = "1 Public Square, Nashville, TN"
+GEOCODE = {"match_addr": ADDRESS, "score": 100, "location": {"x": -86.78, "y": 36.16}}
+PARCEL = {"attributes": {"APN": "1"}, "geometry": None}
+
+
+class FakeClient:
+    """Fake arcgis_client lookups that count calls and can fail or stall per layer."""
+
+    def __init__(self):
+        self.calls = []
+        self.failing = set()
+        self.stalled = set()
+        self.release = threading.Event()
+
+    def lookup(self, name, value):
+        def fake(*args, **kwargs):
+            self.calls.append(name)
+            if name in self.stalled:
+                self.release.wait(5)
+            if name in self.failing:
+                raise ValueError(f"{name} unavailable")
+            return value
+        return fake
+
+    def flood(self, *args, **kwargs):
+        name = "flood_pending" if args[0] == analyzer.METRO["FEMA_PENDING"] else "flood_approved"
+        return self.lookup(name, [])()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient()
+    for name, value in {
+        "geocode_address": GEOCODE,
+        "get_parcel_at_point": PARCEL,
+        "get_base_zoning": {"ZONE_CODE": "DTC"},
+        "get_zoning_overlays": [],
+        "get_nearby_cases": [],
+        "count_nearby_cases": 0,
+    }.items():
+        monkeypatch.setattr(arcgis_client, name, fake.lookup(name, value))
+    monkeypatch.setattr(arcgis_client, "get_flood_hazards", fake.flood)
+    analyzer._RESULT_CACHE.clear()
+    yield fake
+    fake.release.set()
+    analyzer._RESULT_CACHE.clear()
+
+
+def test_complete_analysis_is_cached_as_copy(client):
+    result = analyzer.analyze_property(ADDRESS)
+    assert result["metadata"]["status"] == "success"
+    assert "failed_layers" not in result["metadata"]
+    
+    result["zoning"]["base"] = None
+    cached = analyzer.analyze_property(ADDRESS)
+    assert cached["zoning"]["base"] == {"ZONE_CODE": "DTC"}
+    assert client.calls.count("geocode_address") == 1
+
+
+def test_failed_base_zoning_is_reported_and_not_cached(client):
+    client.failing.add("get_base_zoning")
+    
+    result = analyzer.analyze_property(ADDRESS)
+    assert result["metadata"]["status"] == "success"
+    assert result["metadata"]["failed_layers"] == ["base_zoning"]
+    assert result["zoning"]["base"] is None
+    
+    analyzer.analyze_property(ADDRESS)
+    assert client.calls.count("geocode_address") == 2
+
+
+def test_other_failed_layer_fails_analysis(client):
+    client.failing.add("get_zoning_overlays")
+    
+    result = analyzer.analyze_property(ADDRESS)
+    assert result["metadata"]["status"] == "error"
+    assert "get_zoning_overlays unavailable" in result["error"]
+
+
+def test_slow_layer_is_reported_without_waiting(client, monkeypatch):
+    monkeypatch.setattr(analyzer, "LAYER_QUERY_TIMEOUT", 0.2)
+    client.stalled.add("flood_pending")
+    
+    start = time.monotonic()
+    result = analyzer.analyze_property(ADDRESS)
+    assert time.monotonic() - start < 2
+    assert result["metadata"]["failed_layers"] == ["flood_pending"]
+    assert result["constraints"]["flood_pending"] == []
+    
+    analyzer.analyze_property(ADDRESS)
+    assert client.calls.count("geocode_address") == 2
+
+
+class FakeAsyncClient:
+    """Fake arcgis_client_async lookups mirroring FakeClient."""
+
+    def __init__(self, parcel=PARCEL):
+        self.parcel = parcel
+        self.failing = set()
+        self.cancelled = []
+
+    async def geocode_address(self, *args, **kwargs):
+        return GEOCODE
+
+    async def get_parcel_at_point(self, *args, **kwargs):
+        await asyncio.sleep(0)
+        return self.parcel
+
+    async def get_base_zoning(self, *args, **kwargs):
+        if "get_base_zoning" in self.failing:
+            raise ValueError("get_base_zoning unavailable")
+        return {"ZONE_CODE": "DTC"}
+
+    async def get_nearby_cases(self, *args, **kwargs):
+        try:
+            await asyncio.sleep(0.01)
+        except asyncio.CancelledError:
+            self.cancelled.append("get_nearby_cases")
+            raise
+        return []
+
+    async def count_nearby_cases(self, *args, **kwargs):
+        return 0
+
+    async def get_zoning_overlays(self, *args, **kwargs):
+        return []
+
+    async def get_flood_hazards(self, *args, **kwargs):
+        return []
+
+
+@pytest.fixture
+def async_client(monkeypatch):
+    pytest.importorskip("aiohttp")
+    from src.integrations.metro import arcgis_client_async
+    
+    fake = FakeAsyncClient()
+    for name in (
+        "geocode_address", "get_parcel_at_point", "get_base_zoning", "get_nearby_cases",
+        "count_nearby_cases", "get_zoning_overlays", "get_flood_hazards",
+    ):
+        monkeypatch.setattr(arcgis_client_async, name, getattr(fake, name))
+    analyzer._RESULT_CACHE.clear()
+    yield fake
+    analyzer._RESULT_CACHE.clear()
+
+
+def test_async_failed_base_zoning_is_reported_and_not_cached(async_client):
+    async_client.failing.add("get_base_zoning")
+    
+    result = asyncio.run(analyzer.analyze_property_async(ADDRESS, session=object()))
+    assert result["metadata"]["status"] == "success"
+    assert result["metadata"]["failed_layers"] == ["base_zoning"]
+    assert analyzer._cached_result(ADDRESS) is None
+
+
+def test_async_complete_analysis_is_cached(async_client):
+    result = asyncio.run(analyzer.analyze_property_async(ADDRESS, session=object()))
+    assert "failed_layers" not in result["metadata"]
+    assert analyzer._cached_result(ADDRESS) == result
+
+
+def test_async_no_parcel_cancels_point_lookups(async_client):
+    async_client.parcel = None
+    
+    result = asyncio.run(analyzer.analyze_property_async(ADDRESS, session=object()))
+    assert result["error"] == "No parcel found at the specified location"
+    assert async_client.cancelled == ["get_nearby_cases"]
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
+import orjson
 import requests
 import json
+from requests.adapters import HTTPAdapter
+
+# One keep-alive session for every request to the local API
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_maxsize=8))
 
 def test_api():
     try:
         # Test the API
-        response = requests.get("http://localhost:8000/")
+        response = SESSION.get("http://localhost:8000/")
         print(f"UI Status: {response.status_code}")
         
         # Test developer analysis
@@ -15,11 +21,11 @@ def test_api():
             "include_variance_analysis": True
         }
         
-        response = requests.post("http://localhost:8000/zoning/developer-analysis", json=payload)
+        response = SESSION.post("http://localhost:8000/zoning/developer-analysis", json=payload)
         print(f"API Status: {response.status_code}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"Zoning District: {data.get('zoning_district', 'Unknown')}")
             print(f"Analysis length: {len(data.get('detailed_analysis', ''))}")
             print("✅ API is working!")
@@ -0,0 +1,97 @@
+"""
+Tests for the Metro ArcGIS client.
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("ijson")
+pytest.importorskip("orjson")
+pytest.importorskip("pyproj")
+
+from src.integrations.metro import arcgis_client
+from src.integrations.metro.arcgis_client import WEB_MERCATOR_WKID, parcel_query_geometry
+
+LAYER_URL = "https://example.com/arcgis/rest/services/Layer/MapServer/0"
+POINT = {"x": -86.78, "y": 36.16}
+
+
+class FakeResponse:
+    """Stands in for a requests.Response carrying a JSON body."""
+
+    def __init__(self, body):
+        self.content = json.dumps(body).encode("utf-8")
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Stands in for the shared requests.Session, answering every GET with one body."""
+
+    def __init__(self, body):
+        self.body = body
+        self.requests = []
+
+    def get(self, url, params=None, timeout=None):
+        self.requests.append(url)
+        return FakeResponse(self.body)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Route the client's requests to a FakeSession; set its body per test."""
+    fake = FakeSession({})
+    monkeypatch.setattr(arcgis_client, "_session", lambda: fake)
+    arcgis_client._CACHE.clear()
+    yield fake
+    arcgis_client._CACHE.clear()
+
+
+def test_parcel_query_geometry_projects_polygon():
+    parcel = {
+        "attributes": {},
+        "geometry": {
+            "rings": [[[-86.78, 36.16], [-86.77, 36.16], [-86.77, 36.17], [-86.78, 36.16]]],
+            "spatialReference": {"wkid": 4326},
+        },
+    }
+    geometry = json.loads(parcel_query_geometry(parcel))
+    
+    assert geometry["spatialReference"]["wkid"] == WEB_MERCATOR_WKID
+    x, y = geometry["rings"][0][0]
+    assert x == pytest.approx(-9660305, abs=10)
+    assert y == pytest.approx(4322660, abs=10)
+
+
+def test_parcel_query_geometry_reuses_existing_string():
+    assert parcel_query_geometry({}, "cached") == "cached"
+
+
+def test_error_body_raises_and_is_not_cached(session):
+    session.body = {"error": {"code": 400, "message": "Invalid query"}}
+    
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid query"):
+            arcgis_client.get_nearby_cases(LAYER_URL, POINT["x"], POINT["y"])
+    assert len(session.requests) == 2
+
+
+def test_parcel_lookup_is_cached_and_returned_as_copy(session):
+    session.body = {"features": [{"attributes": {"APN": "1"}, "geometry": {"rings": []}}]}
+    
+    parcel = arcgis_client.get_parcel_at_point(LAYER_URL, POINT)
+    parcel["attributes"]["APN"] = "changed"
+    
+    assert arcgis_client.get_parcel_at_point(LAYER_URL, POINT)["attributes"]["APN"] == "1"
+    assert len(session.requests) == 1
+
+
+def test_base_zoning_error_is_none_unless_raise_errors(session):
+    session.body = {"error": {"code": 500, "message": "Layer unavailable"}}
+    
+    assert arcgis_client.get_base_zoning(LAYER_URL, None, point=POINT) is None
+    with pytest.raises(ValueError, match="Layer unavailable"):
+        arcgis_client.get_base_zoning(LAYER_URL, None, point=POINT, raise_errors=True)
@@ -0,0 +1,88 @@
+"""
+Tests for the asyncio Metro ArcGIS client.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("requests")
+pytest.importorskip("ijson")
+pytest.importorskip("orjson")
+pytest.importorskip("pyproj")
+
+from src.integrations.metro import arcgis_client_async
+from src.integrations.metro.arcgis_client import _CACHE
+
+LAYER_URL = "https://example.com/arcgis/rest/services/Layer/MapServer/0"
+POINT = {"x": -86.78, "y": 36.16}
+
+
+class FakeResponse:
+    """Stands in for an aiohttp response used as an async context manager."""
+
+    def __init__(self, body):
+        self.body = json.dumps(body).encode("utf-8")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return self.body
+
+
+class FakeSession:
+    """Stands in for an aiohttp.ClientSession, answering every GET with one body."""
+
+    def __init__(self, body):
+        self.body = body
+        self.requests = []
+
+    def get(self, url, params=None, timeout=None):
+        self.requests.append(url)
+        return FakeResponse(self.body)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    _CACHE.clear()
+    yield
+    _CACHE.clear()
+
+
+def test_error_body_raises_and_is_not_cached():
+    session = FakeSession({"error": {"code": 400, "message": "Invalid query"}})
+    
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid query"):
+            asyncio.run(arcgis_client_async.get_parcel_at_point(session, LAYER_URL, POINT))
+    assert len(session.requests) == 2
+
+
+def test_parcel_lookup_is_cached_and_returned_as_copy():
+    session = FakeSession({"features": [{"attributes": {"APN": "1"}, "geometry": {"rings": []}}]})
+    
+    parcel = asyncio.run(arcgis_client_async.get_parcel_at_point(session, LAYER_URL, POINT))
+    parcel["attributes"]["APN"] = "changed"
+    
+    parcel = asyncio.run(arcgis_client_async.get_parcel_at_point(session, LAYER_URL, POINT))
+    assert parcel["attributes"]["APN"] == "1"
+    assert len(session.requests) == 1
+
+
+def test_base_zoning_error_is_none_unless_raise_errors():
+    session = FakeSession({"error": {"code": 500, "message": "Layer unavailable"}})
+    
+    assert asyncio.run(arcgis_client_async.get_base_zoning(session, LAYER_URL, None, point=POINT)) is None
+    with pytest.raises(ValueError, match="Layer unavailable"):
+        asyncio.run(arcgis_client_async.get_base_zoning(
+            session, LAYER_URL, None, point=POINT, raise_errors=True
+        ))
@@ -0,0 +1,96 @@
+"""
+Tests for the in-process TTL cache used by the Metro GIS lookups.
+"""
+
+import types
+
+import pytest
+
+from src.integrations.metro import cache
+from src.integrations.metro.cache import TTLCache, cache_key, returns_copy
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the cache's monotonic clock with one the test advances by hand."""
+    now = [1000.0]
+    monkeypatch.setattr(cache, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_get_expires_after_ttl(clock):
+    entries = TTLCache()
+    entries.set("key", "value")
+    
+    clock[0] += 59
+    assert entries.get("key", 60) == "value"
+    clock[0] += 1
+    assert entries.get("key", 60) is None
+    assert entries.get("key", 60, "default") == "default"
+
+
+def test_get_or_fetch_fetches_once_per_ttl(clock):
+    entries = TTLCache()
+    calls = []
+    
+    def fetch():
+        calls.append(None)
+        return len(calls)
+    
+    assert entries.get_or_fetch("key", 60, fetch) == 1
+    assert entries.get_or_fetch("key", 60, fetch) == 1
+    clock[0] += 60
+    assert entries.get_or_fetch("key", 60, fetch) == 2
+
+
+def test_get_or_fetch_caches_none(clock):
+    entries = TTLCache()
+    calls = []
+    
+    def fetch():
+        calls.append(None)
+        return None
+    
+    entries.get_or_fetch("key", 60, fetch)
+    entries.get_or_fetch("key", 60, fetch)
+    assert len(calls) == 1
+
+
+def test_get_or_fetch_does_not_cache_errors(clock):
+    entries = TTLCache()
+    
+    def fail():
+        raise ValueError("ArcGIS error")
+    
+    with pytest.raises(ValueError):
+        entries.get_or_fetch("key", 60, fail)
+    assert entries.get_or_fetch("key", 60, lambda: "value") == "value"
+
+
+def test_set_evicts_oldest_entry_when_full(clock):
+    entries = TTLCache(maxsize=2)
+    entries.set("a", 1)
+    entries.set("b", 2)
+    entries.set("c", 3)
+    
+    assert entries.get("a", 60) is None
+    assert entries.get("b", 60) == 2
+    assert entries.get("c", 60) == 3
+
+
+def test_cache_key_is_stable():
+    params = {"f": "json", "outFields": "*", "returnGeometry": False}
+    reordered = {"returnGeometry": False, "outFields": "*", "f": "json"}
+    
+    assert cache_key("https://example.com/layer", params) == cache_key("https://example.com/layer", reordered)
+    assert cache_key("https://example.com/layer", params) != cache_key("https://example.com/other", params)
+    assert cache_key("a", "b") != cache_key("ab")
+
+
+def test_returns_copy_protects_cached_value():
+    cached = {"attributes": {"APN": "1"}}
+    lookup = returns_copy(lambda: cached)
+    
+    lookup()["attributes"]["APN"] = "changed"
+    assert lookup() == {"attributes": {"APN": "1"}}
+    assert cached["attributes"]["APN"] == "1"
@@ -2,16 +2,21 @@
 Test script for Metro Nashville geocoding service.
 """
 
-import sys
-import os
+import asyncio
 import json
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.abspath('.'))
+async def geocode_all(addresses):
+    """Geocode addresses concurrently over one aiohttp session; errors are returned, not raised."""
+    from src.config.metro import METRO
+    from src.integrations.metro.arcgis_client_async import create_session, geocode_address
+    
+    async with create_session() as session:
+        return await asyncio.gather(
+            *(geocode_address(session, METRO["GEOCODER"], address) for address in addresses),
+            return_exceptions=True
+        )
 
 def main():
-    from src.integrations.metro.arcgis_client import metro_geocode
-    
     test_addresses = [
         "100 Broadway, Nashville, TN",
         "222 2nd Ave S, Nashville, TN",
@@ -21,18 +26,18 @@ def main():
     
     print("Testing Metro Nashville Geocoding Service\n" + "="*40)
     
-    for address in test_addresses:
+    results = asyncio.run(geocode_all(test_addresses))
+    
+    for address, result in zip(test_addresses, results):
         print(f"\n🔍 Geocoding: {address}")
-        try:
-            result = metro_geocode(address)
-            if result:
-                print(f"✅ Found: {result.get('address', 'N/A')}")
-                print(f"   Score: {result.get('score', 'N/A')}")
-                print(f"   Location: {result.get('location', {}).get('y', 'N/A')}, {result.get('location', {}).get('x', 'N/A')}")
-            else:
-                print("❌ No results found")
-        except Exception as e:
-            print(f"❌ Error: {str(e)}")
+        if isinstance(result, Exception):
+            print(f"❌ Error: {str(result)}")
+        elif result:
+            print(f"✅ Found: {result.get('address', 'N/A')}")
+            print(f"   Score: {result.get('score', 'N/A')}")
+            print(f"   Location: {result.get('location', {}).get('y', 'N/A')}, {result.get('location', {}).get('x', 'N/A')}")
+        else:
+            print("❌ No results found")
 
 if __name__ == "__main__":
     main()
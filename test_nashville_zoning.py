@@ -4,17 +4,30 @@ Test script for Nashville Zoning AI Assistant
 Demonstrates the key functionality for commercial real estate developers
 """
 
+import functools
+import orjson
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any
 
 # API base URL
 BASE_URL = "http://localhost:8000"
 
-def test_developer_analysis():
+# Section rules for the console report
+SEPARATOR = "=" * 50
+BANNER_SEPARATOR = "=" * 60
+
+# One keep-alive session shared by all endpoint tests
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_maxsize=8))
+
+def _developer_report():
     """Test comprehensive developer analysis for a Nashville property"""
-    print("🏢 Testing Comprehensive Developer Analysis")
-    print("=" * 50)
+    lines = []
+    lines.append("🏢 Testing Comprehensive Developer Analysis")
+    lines.append(SEPARATOR)
     
     payload = {
         "address": "100 Broadway, Nashville, TN",
@@ -23,25 +36,28 @@ def test_developer_analysis():
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/zoning/developer-analysis", json=payload)
+        response = SESSION.post(f"{BASE_URL}/zoning/developer-analysis", json=payload)
         if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Address: {data['address']}")
-            print(f"📍 Coordinates: {data['coordinates']}")
-            print(f"🏘️  Zoning District: {data['zoning_district']}")
-            print(f"📊 Facts Extracted: {len(data['facts'])} items")
-            print(f"📄 Sources: {len(data['sources'])} documents")
-            print("\n📋 Detailed Analysis Preview:")
-            print(data['detailed_analysis'][:500] + "...")
+            data = orjson.loads(response.content)
+            lines.append(f"✅ Address: {data['address']}")
+            lines.append(f"📍 Coordinates: {data['coordinates']}")
+            lines.append(f"🏘️  Zoning District: {data['zoning_district']}")
+            lines.append(f"📊 Facts Extracted: {len(data['facts'])} items")
+            lines.append(f"📄 Sources: {len(data['sources'])} documents")
+            lines.append("\n📋 Detailed Analysis Preview:")
+            lines.append(data['detailed_analysis'][:500] + "...")
         else:
-            print(f"❌ Error: {response.status_code} - {response.text}")
+            lines.append(f"❌ Error: {response.status_code} - {response.text}")
     except Exception as e:
-        print(f"❌ Connection Error: {e}")
+        lines.append(f"❌ Connection Error: {e}")
+    
+    return "\n".join(lines)
 
-def test_use_specific_analysis():
+def _use_analysis_report():
     """Test use-specific analysis for a restaurant development"""
-    print("\n🍽️  Testing Use-Specific Analysis")
-    print("=" * 50)
+    lines = []
+    lines.append("\n🍽️  Testing Use-Specific Analysis")
+    lines.append(SEPARATOR)
     
     payload = {
         "address": "456 Music Row, Nashville, TN",
@@ -49,24 +65,27 @@ def test_use_specific_analysis():
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/zoning/use-analysis", json=payload)
+        response = SESSION.post(f"{BASE_URL}/zoning/use-analysis", json=payload)
         if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Address: {data['address']}")
-            print(f"🏘️  Zoning District: {data['zoning_district']}")
-            print(f"🎯 Use Type: {data['use_type']}")
-            print(f"📄 Sources: {len(data['sources'])} documents")
-            print("\n📋 Analysis Preview:")
-            print(data['analysis'][:400] + "...")
+            data = orjson.loads(response.content)
+            lines.append(f"✅ Address: {data['address']}")
+            lines.append(f"🏘️  Zoning District: {data['zoning_district']}")
+            lines.append(f"🎯 Use Type: {data['use_type']}")
+            lines.append(f"📄 Sources: {len(data['sources'])} documents")
+            lines.append("\n📋 Analysis Preview:")
+            lines.append(data['analysis'][:400] + "...")
         else:
-            print(f"❌ Error: {response.status_code} - {response.text}")
+            lines.append(f"❌ Error: {response.status_code} - {response.text}")
     except Exception as e:
-        print(f"❌ Connection Error: {e}")
+        lines.append(f"❌ Connection Error: {e}")
+    
+    return "\n".join(lines)
 
-def test_variance_analysis():
+def _variance_report():
     """Test variance analysis for a development project"""
-    print("\n⚖️  Testing Variance Analysis")
-    print("=" * 50)
+    lines = []
+    lines.append("\n⚖️  Testing Variance Analysis")
+    lines.append(SEPARATOR)
     
     payload = {
         "address": "789 Hillsboro Pike, Nashville, TN",
@@ -76,25 +95,28 @@ def test_variance_analysis():
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/zoning/variance-analysis", json=payload)
+        response = SESSION.post(f"{BASE_URL}/zoning/variance-analysis", json=payload)
         if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Address: {data['address']}")
-            print(f"🏘️  Zoning District: {data['zoning_district']}")
-            print(f"🎯 Proposed Use: {data['proposed_use']}")
-            print(f"📏 Variance Types: {', '.join(data['variance_types'])}")
-            print(f"📄 Sources: {len(data['sources'])} documents")
-            print("\n📋 Variance Analysis Preview:")
-            print(data['analysis'][:400] + "...")
+            data = orjson.loads(response.content)
+            lines.append(f"✅ Address: {data['address']}")
+            lines.append(f"🏘️  Zoning District: {data['zoning_district']}")
+            lines.append(f"🎯 Proposed Use: {data['proposed_use']}")
+            lines.append(f"📏 Variance Types: {', '.join(data['variance_types'])}")
+            lines.append(f"📄 Sources: {len(data['sources'])} documents")
+            lines.append("\n📋 Variance Analysis Preview:")
+            lines.append(data['analysis'][:400] + "...")
         else:
-            print(f"❌ Error: {response.status_code} - {response.text}")
+            lines.append(f"❌ Error: {response.status_code} - {response.text}")
     except Exception as e:
-        print(f"❌ Connection Error: {e}")
+        lines.append(f"❌ Connection Error: {e}")
+    
+    return "\n".join(lines)
 
-def test_quick_snapshot():
+def _snapshot_report():
     """Test quick zoning snapshot"""
-    print("\n⚡ Testing Quick Zoning Snapshot")
-    print("=" * 50)
+    lines = []
+    lines.append("\n⚡ Testing Quick Zoning Snapshot")
+    lines.append(SEPARATOR)
     
     payload = {
         "address": "321 Demonbreun St, Nashville, TN",
@@ -102,26 +124,38 @@ def test_quick_snapshot():
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/zoning/snapshot", json=payload)
+        response = SESSION.post(f"{BASE_URL}/zoning/snapshot", json=payload)
         if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Address: {payload['address']}")
-            print(f"📊 Facts: {len(data['facts'])} items")
-            print("\n📋 Key Facts:")
+            data = orjson.loads(response.content)
+            lines.append(f"✅ Address: {payload['address']}")
+            lines.append(f"📊 Facts: {len(data['facts'])} items")
+            lines.append("\n📋 Key Facts:")
             for key, value in data['facts'].items():
-                print(f"  • {key}: {value}")
-            print(f"\n📄 Sources: {len(data['sources'])} documents")
+                lines.append(f"  • {key}: {value}")
+            lines.append(f"\n📄 Sources: {len(data['sources'])} documents")
         else:
-            print(f"❌ Error: {response.status_code} - {response.text}")
+            lines.append(f"❌ Error: {response.status_code} - {response.text}")
     except Exception as e:
-        print(f"❌ Connection Error: {e}")
+        lines.append(f"❌ Connection Error: {e}")
+    
+    return "\n".join(lines)
+
+@functools.lru_cache(maxsize=256)
+def _geocode(address):
+    """Memoized app.tools.geocode_address, so repeat addresses skip the network"""
+    from app.tools import geocode_address
+    return geocode_address(address)
+
+@functools.lru_cache(maxsize=256)
+def _zoning_district(coords):
+    """Memoized app.tools.get_zoning_district, keyed by the coordinate tuple"""
+    from app.tools import get_zoning_district
+    return get_zoning_district(coords)
 
 def test_geocoding():
     """Test address geocoding functionality"""
     print("\n🗺️  Testing Address Geocoding")
-    print("=" * 50)
-    
-    from app.tools import geocode_address, get_zoning_district
+    print(SEPARATOR)
     
     test_addresses = [
         "100 Broadway, Nashville, TN",
@@ -131,9 +165,9 @@ def test_geocoding():
     
     for address in test_addresses:
         try:
-            coords = geocode_address(address)
+            coords = _geocode(address)
             if coords:
-                zoning = get_zoning_district(coords)
+                zoning = _zoning_district(tuple(coords))
                 print(f"✅ {address}")
                 print(f"   📍 Coordinates: {coords[0]:.4f}, {coords[1]:.4f}")
                 print(f"   🏘️  Zoning District: {zoning}")
@@ -145,18 +179,24 @@ def test_geocoding():
 def main():
     """Run all tests"""
     print("🚀 Nashville Zoning AI Assistant - Test Suite")
-    print("=" * 60)
+    print(BANNER_SEPARATOR)
     print("Make sure the API server is running: uvicorn app.api:app --reload")
-    print("=" * 60)
+    print(BANNER_SEPARATOR)
     
     # Test geocoding first (doesn't require API)
     test_geocoding()
     
-    # Test API endpoints
-    test_quick_snapshot()
-    test_use_specific_analysis()
-    test_variance_analysis()
-    test_developer_analysis()
+    # Test API endpoints; each waits on an LLM-backed request, so run them
+    # concurrently and print their reports in order once all are done
+    endpoint_reports = [
+        _snapshot_report,
+        _use_analysis_report,
+        _variance_report,
+        _developer_report,
+    ]
+    with ThreadPoolExecutor(max_workers=len(endpoint_reports)) as executor:
+        for report in executor.map(lambda build: build(), endpoint_reports):
+            print(report)
     
     print("\n🎉 Test suite completed!")
     print("\n💡 Next steps:")
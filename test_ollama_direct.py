@@ -1,10 +1,27 @@
-from ollama import Client
+import asyncio
 
-client = Client(host='http://127.0.0.1:11434')
-res = client.chat(
-    model='llama3:latest',
-    messages=[{'role': 'user', 'content': "Say 'direct client works' in four words or fewer."}]
-)
-print(res['message']['content'])
+from ollama import AsyncClient
 
+PROMPTS = [
+    "Say 'direct client works' in four words or fewer.",
+    "Say 'Ollama + LlamaIndex is working.' Keep it short.",
+]
 
+
+async def main():
+    # Both prompts share one model load; with OLLAMA_NUM_PARALLEL >= 2 the
+    # server also decodes them concurrently
+    client = AsyncClient(host='http://127.0.0.1:11434')
+    responses = await asyncio.gather(*(
+        client.chat(
+            model='llama3:latest',
+            messages=[{'role': 'user', 'content': prompt}],
+            keep_alive='30m'  # keep the model loaded for the other Ollama tests
+        )
+        for prompt in PROMPTS
+    ))
+    for res in responses:
+        print(res['message']['content'])
+
+
+asyncio.run(main())
@@ -1,8 +1,17 @@
 import warnings, urllib3
 warnings.filterwarnings("ignore", category=urllib3.exceptions.NotOpenSSLWarning)
 
+import requests
 from llama_index.llms.ollama import Ollama
 
+# Load the model up front and keep it resident for 30 minutes, so repeat runs
+# (and test_ollama_direct.py) skip the cold load
+requests.post(
+    "http://127.0.0.1:11434/api/generate",
+    json={"model": "llama3:latest", "prompt": "", "keep_alive": "30m"},
+    timeout=600
+).raise_for_status()
+
 # Use the model you already have locally; explicit base_url + long timeout
 llm = Ollama(
     model="llama3:latest",
@@ -2,12 +2,9 @@
 Test script for Metro Nashville parcel lookup.
 """
 
-import sys
-import os
 import json
-
-# Add the project root to the Python path
-sys.path.insert(0, os.path.abspath('.'))
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 def main():
     from src.integrations.metro.arcgis_client import get_parcel_at_point
@@ -21,11 +18,24 @@ def main():
     
     print("Testing Metro Nashville Parcel Lookup\n" + "="*40)
     
-    for point in test_points:
-        print(f"\n🔍 Looking up parcel at {point['name']} ({point['y']}, {point['x']})")
+    def lookup(point):
         try:
-            parcel = get_parcel_at_point(METRO["PARCELS"], point)
-            if parcel and 'attributes' in parcel:
+            return get_parcel_at_point(METRO["PARCELS"], point), None
+        except Exception as e:
+            return None, e
+    
+    # The lookups are independent network round-trips, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(test_points)) as executor:
+        results = list(executor.map(lookup, test_points))
+    
+    # Collect every response in one NDJSON file for inspection
+    with open('parcel_responses.jsonl', 'w') as out:
+        for point, (parcel, error) in zip(test_points, results):
+            print(f"\n🔍 Looking up parcel at {point['name']} ({point['y']}, {point['x']})")
+            if error is not None:
+                print(f"❌ Error: {str(error)}")
+                traceback.print_exception(type(error), error, error.__traceback__)
+            elif parcel and 'attributes' in parcel:
                 attrs = parcel['attributes']
                 print("✅ Found parcel with attributes:")
                 
@@ -40,16 +50,10 @@ def main():
                     if geom_type == 'dict' and 'x' in parcel['geometry'] and 'y' in parcel['geometry']:
                         print(f"   Location: {parcel['geometry']['y']}, {parcel['geometry']['x']}")
                 
-                # Print the full response to a file for inspection
-                with open('parcel_response.json', 'w') as f:
-                    json.dump(parcel, f, indent=2)
-                print("\n   Full response saved to parcel_response.json")
+                out.write(json.dumps({"name": point["name"], "parcel": parcel}) + "\n")
+                print("\n   Full response saved to parcel_responses.jsonl")
             else:
                 print("❌ No parcel found at this location")
-        except Exception as e:
-            print(f"❌ Error: {str(e)}")
-            import traceback
-            traceback.print_exc()
 
 if __name__ == "__main__":
     main()
@@ -1,72 +1,18 @@
+import io
 import json
+import re
+import ijson
 import requests
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from string import Template
+from jinja2 import ChainableUndefined, Environment, Undefined
 
-# Custom CSS for better typography and layout
-st.markdown("""
-    <style>
-        /* Set Times New Roman as the primary font */
-        * {
-            font-family: 'Times New Roman', Times, serif !important;
-        }
-        
-        /* Main title styling */
-        h1 {
-            color: #2c3e50;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 10px;
-            margin-bottom: 1.5rem;
-        }
-        
-        /* Section headers */
-        h2 {
-            color: #2c3e50;
-            margin-top: 1.5rem;
-            margin-bottom: 0.75rem;
-            border-left: 4px solid #3498db;
-            padding-left: 10px;
-        }
-        
-        /* Cards for different sections */
-        .card {
-            background-color: #f8f9fa;
-            border-radius: 8px;
-            padding: 1.25rem;
-            margin-bottom: 1.5rem;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        
-        /* Better spacing for form elements */
-        .stTextInput, .stCheckbox {
-            margin-bottom: 1rem;
-        }
-        
-        /* Facts list styling */
-        .fact-category {
-            font-weight: bold;
-            color: #2c3e50;
-            margin-top: 1rem;
-        }
-        
-        .fact-item {
-            margin: 0.5rem 0;
-            padding-left: 1rem;
-            border-left: 2px solid #e0e0e0;
-        }
-        
-        /* Source list styling */
-        .source-item {
-            font-size: 0.9rem;
-            color: #666;
-            margin: 0.5rem 0;
-            padding: 0.5rem;
-            background-color: #f1f3f5;
-            border-radius: 4px;
-        }
-    </style>
-""", unsafe_allow_html=True)
+# Longer analyses show this many characters up front and the rest in an expander
+ANALYSIS_PREVIEW_CHARS = 4096
 
 # Page config
 st.set_page_config(
@@ -76,6 +22,15 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_data
+def _css():
+    """Custom CSS for typography and layout, minified once per process"""
+    css = (Path(__file__).parent / "app" / "style.css").read_text()
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)  # comments
+    return re.sub(r"\s+", " ", css).strip()
+
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
+
 # Main title
 st.title("Nashville Zoning AI Assistant")
 
@@ -87,71 +42,115 @@ with st.sidebar:
     proposed_use = st.text_input("Proposed Use (Optional)", placeholder="e.g., mixed-use development, single-family home")
     include_variance = st.checkbox("Include Variance Analysis", value=False, help="Check to include variance potential and process")
     
+    st.session_state.setdefault("analyze_clicked", False)
     if st.button("Analyze Property", type="primary", use_container_width=True):
         st.session_state.analyze_clicked = True
-    else:
-        if 'analyze_clicked' not in st.session_state:
-            st.session_state.analyze_clicked = False
 
+@st.cache_data
 def load_renderer_template():
-    """Load the renderer template from file"""
+    """Load the report section of the renderer template from file (cached per process)"""
     template_path = Path(__file__).parent / "app" / "renderer_prompt.md"
     try:
         with open(template_path, 'r') as f:
             # Read the entire template content
             content = f.read()
-            # Find the start of the template (after the instructions)
-            template_start = content.find('**Property Zoning Analysis**')
-            if template_start == -1:
-                return content  # Return as is if we can't find the marker
-            return content[template_start:]
     except Exception as e:
         st.error(f"Error loading renderer template: {e}")
         return None
+    
+    # Find the start of the template (after the instructions); use it as is if
+    # we can't find the marker
+    template_start = content.find('**Property Zoning Analysis**')
+    if template_start == -1:
+        return content
+    return content[template_start:]
+
+def _missing(value):
+    return value is None or value == '' or isinstance(value, Undefined)
+
+@st.cache_resource
+def get_jinja_env():
+    """Jinja environment with the report's fallback filters"""
+    # ChainableUndefined lets the template walk into absent sections (e.g.
+    # standards.setbacks_ft.front) and fall through to the filter defaults
+    env = Environment(autoescape=False, auto_reload=False, undefined=ChainableUndefined)
+    env.filters["or_"] = lambda value, default: default if _missing(value) else value
+    env.filters["listOr"] = lambda value, default: (
+        default if _missing(value) or not value
+        else ', '.join(str(v) for v in value) if isinstance(value, list)
+        else str(value)
+    )
+    env.filters["boolOr"] = lambda value, default: default if _missing(value) else ('Yes' if value else 'No')
+    return env
+
+@st.cache_resource
+def get_report_template():
+    """Compile the renderer template once per process, or None if it couldn't be loaded"""
+    source = load_renderer_template()
+    if source is None:
+        return None
+    return get_jinja_env().from_string(source)
+
+@st.cache_resource
+def http():
+    """Pooled keep-alive session shared by all backend calls"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.2))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_analysis(backend, address, proposed_use, include_variance):
+    """POST an analysis request to the backend; repeat requests within an hour are served from cache"""
+    payload = {
+        "address": address,
+        "include_variance_analysis": include_variance
+    }
+    if proposed_use:
+        payload["proposed_use"] = proposed_use
+    
+    # Decode the body as it is read rather than buffering it first
+    with http().post(f"{backend}/analyze", json=payload, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        return dict(ijson.kvitems(response.raw, "", use_float=True))
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def fetch_static_map(_session, backend, address):
+    """Fetch the static map response for an address (cached for a day), or None on an error status.
+
+    The pooled session is passed in (and left out of the cache key) so the
+    function makes no other Streamlit calls and can run on the map worker thread.
+    """
+    m = _session.post(
+        f"{backend}/map/static",
+        json={"address": address},
+        timeout=30
+    )
+    return m.json() if m.ok else None
+
+@st.cache_data(max_entries=32)
+def facts_html(facts):
+    """Build the facts section HTML once per distinct facts dict"""
+    parts = []
+    for category, items in facts.items():
+        if isinstance(items, dict):
+            parts.append(f"<div class='fact-category'>{category.replace('_', ' ').title()}</div>")
+            for key, value in items.items():
+                if value:  # Only show if value exists
+                    parts.append(f"<div class='fact-item'><b>{key.replace('_', ' ').title()}:</b> {value}</div>")
+            parts.append("<br>")
+    return "".join(parts)
 
 def render_report(template, data):
-    """Render the report using the template and data"""
+    """Render the report using a template from get_report_template() and data"""
     try:
         # Convert data to dict if it's a string
         if isinstance(data, str):
             data = json.loads(data)
         
-        # Helper functions for template
-        def or_filter(value, default):
-            return value if value is not None and value != '' else default
-            
-        def list_or(value, default):
-            if not value:
-                return default
-            if isinstance(value, list):
-                return ', '.join(str(v) for v in value) if value else default
-            return str(value)
-        
-        def bool_or(value, default):
-            if value is None:
-                return default
-            return 'Yes' if value else 'No'
-        
-        # Create a template with our custom filters
-        template = (
-            template
-            .replace('{', '{{')
-            .replace('}', '}}')
-            .replace('[[', '{')
-            .replace(']]', '}')
-            .replace('| or:', '|or:')
-            .replace('| listOr:', '|listOr:')
-            .replace('| boolOr:', '|boolOr:')
-        )
-        
-        # Add our helper functions to the data
-        data['or'] = or_filter
-        data['listOr'] = list_or
-        data['boolOr'] = bool_or
-        
-        # Format the template with the data
-        report = template.format(**data)
-        return report
+        return template.render(data)
         
     except Exception as e:
         st.error(f"Error rendering report: {e}")
@@ -160,29 +159,32 @@ def render_report(template, data):
         return None
 
 # Main content
-if st.session_state.analyze_clicked:
+if st.session_state.analyze_clicked or st.session_state.get("analysis_data"):
+    report = None
+    map_future = None
     with st.spinner("Analyzing property details..."):
         try:
             # Load the renderer template
-            template = load_renderer_template()
-            if not template:
+            template = get_report_template()
+            if template is None:
                 st.error("Failed to load renderer template")
                 st.stop()
                 
-            payload = {
-                "address": address,
-                "include_variance_analysis": include_variance
-            }
-            if proposed_use:
-                payload["proposed_use"] = proposed_use
+            # Only a click runs a new analysis; any other widget change just
+            # redisplays the last one
+            if st.session_state.analyze_clicked:
+                st.session_state.analyze_clicked = False
+                
+                # Fetch the static map in the background while the analysis runs
+                executor = ThreadPoolExecutor(max_workers=1)
+                map_future = executor.submit(fetch_static_map, http(), backend, address)
+                executor.shutdown(wait=False)
                 
-            # Make API call
-            response = requests.post(f"{backend}/analyze", json=payload)
-            response.raise_for_status()
-            data = response.json()
+                # Make API call and store the raw data in session state
+                st.session_state.analysis_data = fetch_analysis(backend, address, proposed_use, include_variance)
+                st.session_state.analysis_request = (backend, address)
             
-            # Store the raw data in session state
-            st.session_state.analysis_data = data
+            data = st.session_state.analysis_data
             
             # Render the report
             report = render_report(template, data)
@@ -217,25 +219,25 @@ if st.session_state.analyze_clicked:
         col1, col2 = st.columns([3, 2])
         
         with col1:
-            st.markdown(f"**Address:** {data.get('address', 'N/A')}")
-            st.markdown(f"**Zoning District:** `{data.get('zoning_district', 'Unknown')}`")
+            # The rendered report already opens with the address and district
+            if not report:
+                st.markdown(f"**Address:** {data.get('address', 'N/A')}")
+                st.markdown(f"**Zoning District:** `{data.get('zoning_district', 'Unknown')}`")
             if data.get("coordinates"):
                 lat, lon = data["coordinates"]
                 st.markdown(f"**Location:** {lat:.5f}°N, {lon:.5f}°W")
         
         with col2:
             if data.get("coordinates"):
+                analyzed_backend, analyzed_address = st.session_state.analysis_request
                 try:
-                    m = requests.post(
-                        f"{backend}/map/static",
-                        json={"address": address},
-                        timeout=30
-                    )
-                    if m.ok and m.json().get("map_url"):
+                    m = map_future.result() if map_future else fetch_static_map(http(), analyzed_backend, analyzed_address)
+                    map_url = m and m.get("map_url")
+                    if map_url:
                         st.image(
-                            m.json().get("map_url"),
-                            caption=f"Location: {address}",
-                            use_column_width=True
+                            map_url,
+                            caption=f"Location: {analyzed_address}",
+                            use_container_width=True
                         )
                 except:
                     pass
@@ -244,7 +246,20 @@ if st.session_state.analyze_clicked:
         
         # Analysis Section
         st.markdown("### Zoning Analysis")
-        st.markdown("<div class='card'>" + data.get("detailed_analysis", "No analysis available.").replace("\n", "<br>") + "</div>", unsafe_allow_html=True)
+        analysis = data.get("detailed_analysis", "No analysis available.")
+        if len(analysis) > ANALYSIS_PREVIEW_CHARS:
+            # Show a bounded preview, ending at a paragraph break where possible,
+            # and keep the rest collapsed
+            cut = analysis.rfind("\n\n", 0, ANALYSIS_PREVIEW_CHARS)
+            if cut <= 0:
+                cut = ANALYSIS_PREVIEW_CHARS
+            with st.container(border=True):
+                st.markdown(analysis[:cut] + " …")
+            with st.expander("Show full analysis"):
+                st.markdown(analysis[cut:])
+        else:
+            with st.container(border=True):
+                st.markdown(analysis)
         
         # Facts Section
         if data.get("facts"):
@@ -252,14 +267,7 @@ if st.session_state.analyze_clicked:
             facts_col1, facts_col2 = st.columns(2)
             
             with facts_col1:
-                for category, items in data["facts"].items():
-                    if isinstance(items, dict):
-                        st.markdown(f"<div class='fact-category'>{category.replace('_', ' ').title()}</div>", unsafe_allow_html=True)
-                        if isinstance(items, dict):
-                            for key, value in items.items():
-                                if value:  # Only show if value exists
-                                    st.markdown(f"<div class='fact-item'><b>{key.replace('_', ' ').title()}:</b> {value}</div>", unsafe_allow_html=True)
-                        st.markdown("<br>", unsafe_allow_html=True)
+                st.markdown(facts_html(data["facts"]), unsafe_allow_html=True)
             
             with facts_col2:
                 # Handle any remaining facts that might not fit in the first column
@@ -269,15 +277,17 @@ if st.session_state.analyze_clicked:
         # Sources Section
         if data.get("sources"):
             st.markdown("### Reference Sources")
-            st.markdown("<div class='card'><p>This analysis was generated using the following sources:</p>", unsafe_allow_html=True)
+            buf = io.StringIO()
+            buf.write("<div class='card'><p>This analysis was generated using the following sources:</p>")
             
             for source in data.get("sources", [])[:5]:  # Limit to top 5 sources
                 source_text = f"{source.get('source', 'Unknown')}"
                 if source.get('page'):
                     source_text += f" (Page {source['page']})"
-                st.markdown(f"<div class='source-item'>{source_text}</div>", unsafe_allow_html=True)
+                buf.write(f"<div class='source-item'>{source_text}</div>")
             
-            st.markdown("</div>", unsafe_allow_html=True)
+            buf.write("</div>")
+            st.markdown(buf.getvalue(), unsafe_allow_html=True)
         
         # Footer
         st.markdown("---")
@@ -2,38 +2,89 @@
 import warnings, urllib3
 warnings.filterwarnings("ignore", category=urllib3.exceptions.NotOpenSSLWarning)
 
+import multiprocessing
+import os
+import threading
+from functools import lru_cache
+
 # --- LlamaIndex + Ollama setup ---
 from llama_index.llms.ollama import Ollama
 from llama_index.embeddings.ollama import OllamaEmbedding
 from llama_index.core import Settings, SimpleDirectoryReader, VectorStoreIndex
 
-# Point LlamaIndex at your local Ollama server; give a long timeout for first call
-Settings.llm = Ollama(
-    model="llama3:latest",
-    base_url="http://127.0.0.1:11434",
-    request_timeout=600.0,
-    temperature=0.1,
-)
-
-# 🔑 Force embeddings to be local (avoids OpenAI API key problem)
-Settings.embed_model = OllamaEmbedding(model_name="llama3:latest")
-
-# --- Load your local zoning documents ---
-# Put TXT or PDF files in the 'zoning_docs' folder on your Desktop/zoning-agent
-documents = SimpleDirectoryReader(
-    "zoning_docs",
-    recursive=True,
-    required_exts=[".txt"],
-    filename_as_id=True,
-).load_data()
-
-# --- Build a vector index and ask a starter question ---
-index = VectorStoreIndex.from_documents(documents)
-query_engine = index.as_query_engine(similarity_top_k=3)
-
-prompt = "Summarize the key zoning rules in exactly 3 short bullet points."
-response = query_engine.query(prompt)
-
-print("\n=== ANSWER ===")
-print(str(response))
-print("\n(Top-3 similar chunks were searched.)")
+# Point LlamaIndex at your local Ollama server; give a long timeout for first call.
+# The clients are created once per process and shared by every importer.
+@lru_cache(maxsize=None)
+def get_llm():
+    return Ollama(
+        model="llama3:latest",
+        base_url="http://127.0.0.1:11434",
+        request_timeout=600.0,
+        temperature=0.1,
+    )
+
+
+# 🔑 Force embeddings to be local (avoids OpenAI API key problem).
+# Use a dedicated embedding model, and send chunks to Ollama in batches.
+EMBED_MODEL = "nomic-embed-text"
+
+
+@lru_cache(maxsize=None)
+def get_embed_model():
+    return OllamaEmbedding(model_name=EMBED_MODEL, embed_batch_size=64)
+
+
+Settings.llm = get_llm()
+Settings.embed_model = get_embed_model()
+
+# Embedded index is saved here, per embedding model (vectors from different
+# models aren't comparable); delete the folder to re-embed after changing zoning_docs
+PERSIST_DIR = os.path.join("zoning_index", EMBED_MODEL.replace(":", "_"))
+
+# Serializes index builds, so a caller racing the warm-up thread loads the
+# persisted index instead of embedding the documents a second time
+_INDEX_LOCK = threading.Lock()
+
+
+# --- Load your local zoning documents into a vector index (once per process) ---
+@lru_cache(maxsize=None)
+def get_index():
+    with _INDEX_LOCK:
+        if os.path.isdir(PERSIST_DIR):
+            from llama_index.core import StorageContext, load_index_from_storage
+            return load_index_from_storage(StorageContext.from_defaults(persist_dir=PERSIST_DIR))
+
+        # Put TXT or PDF files in the 'zoning_docs' folder on your Desktop/zoning-agent
+        documents = SimpleDirectoryReader(
+            "zoning_docs",
+            recursive=True,
+            required_exts=[".txt"],
+            filename_as_id=True,
+        ).load_data(num_workers=os.cpu_count())
+        index = VectorStoreIndex.from_documents(documents)
+        index.storage_context.persist(PERSIST_DIR)
+        return index
+
+
+@lru_cache(maxsize=None)
+def get_query_engine():
+    return get_index().as_query_engine(similarity_top_k=3)
+
+
+# --- Warm up the index, embedding model and LLM without blocking the importer ---
+def warm_up():
+    threading.Thread(target=lambda: get_query_engine().query("ping"), daemon=True).start()
+
+
+# --- Ask a starter question ---
+if __name__ == "__main__":
+    prompt = "Summarize the key zoning rules in exactly 3 short bullet points."
+    response = get_query_engine().query(prompt)
+
+    print("\n=== ANSWER ===")
+    print(str(response))
+    print("\n(Top-3 similar chunks were searched.)")
+elif multiprocessing.parent_process() is None:
+    # Spawned child processes (e.g. document reader workers) re-import this
+    # module; only the top-level process starts the warm-up
+    warm_up()